@@ -14,10 +14,12 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_AREA_M2, CONF_ENERGY_LABEL, DOMAIN
+from .const import CONF_AREA_M2, CONF_ENERGY_LABEL, DOMAIN, UNAVAILABLE_STATES
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 class CoordinatorHeatDemandBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor that indicates heat demand using coordinator."""
@@ -102,7 +104,7 @@ class HeatDemandBinarySensor(BinarySensorEntity):
             return
 
         state = self.hass.states.get(entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
+        if state is None or state.state in UNAVAILABLE_STATES:
             self._attr_available = False
             self._extra_attrs = {"net_heat_entity_id": entity_id}
             return
@@ -22,6 +22,7 @@ from .const import (
     DEFAULT_OUTDOOR_TEMP_COEFFICIENT,
     DEFAULT_THERMAL_STORAGE_EFFICIENCY,
     U_VALUE_MAP,
+    UNAVAILABLE_STATES,
 )
 from .entity import BaseUtilitySensor
 
@@ -234,19 +235,16 @@ class CalibrationSensor(BaseUtilitySensor):
         try:
             # Get theoretical heat loss from sensor
             heat_loss_state = self.hass.states.get(self.heat_loss_sensor)
-            if not heat_loss_state or heat_loss_state.state in (
-                "unknown",
-                "unavailable",
-            ):
+            if not heat_loss_state or heat_loss_state.state in UNAVAILABLE_STATES:
                 return None
 
             theoretical_heat_loss_kw = float(heat_loss_state.state)
 
             # Get actual thermal power from heat pump
             thermal_power_state = self.hass.states.get(self.thermal_power_sensor)
-            if not thermal_power_state or thermal_power_state.state in (
-                "unknown",
-                "unavailable",
+            if (
+                not thermal_power_state
+                or thermal_power_state.state in UNAVAILABLE_STATES
             ):
                 return None
 
@@ -281,7 +279,7 @@ class CalibrationSensor(BaseUtilitySensor):
         try:
             # Get current COP
             cop_state = self.hass.states.get(self.cop_sensor)
-            if not cop_state or cop_state.state in ("unknown", "unavailable"):
+            if not cop_state or cop_state.state in UNAVAILABLE_STATES:
                 return None
 
             actual_cop = float(cop_state.state)
@@ -290,10 +288,7 @@ class CalibrationSensor(BaseUtilitySensor):
             outdoor_temp = 7.0  # Default assumption
             if self.outdoor_sensor:
                 outdoor_state = self.hass.states.get(self.outdoor_sensor)
-                if outdoor_state and outdoor_state.state not in (
-                    "unknown",
-                    "unavailable",
-                ):
+                if outdoor_state and outdoor_state.state not in UNAVAILABLE_STATES:
                     try:
                         outdoor_temp = float(outdoor_state.state)
                     except (ValueError, TypeError):
@@ -302,10 +297,7 @@ class CalibrationSensor(BaseUtilitySensor):
             supply_temp = 28.0  # Default assumption
             if self.supply_temp_sensor:
                 supply_state = self.hass.states.get(self.supply_temp_sensor)
-                if supply_state and supply_state.state not in (
-                    "unknown",
-                    "unavailable",
-                ):
+                if supply_state and supply_state.state not in UNAVAILABLE_STATES:
                     try:
                         supply_temp = float(supply_state.state)
                     except (ValueError, TypeError):
@@ -458,7 +450,7 @@ class CalibrationSensor(BaseUtilitySensor):
 
             # Process thermal data (kW -> kWh per day)
             for state in thermal_states:
-                if state.state in ("unknown", "unavailable"):
+                if state.state in UNAVAILABLE_STATES:
                     continue
                 try:
                     date_key = state.last_updated.date()
@@ -475,7 +467,7 @@ class CalibrationSensor(BaseUtilitySensor):
 
             # Process outdoor temperature data
             for state in outdoor_states:
-                if state.state in ("unknown", "unavailable"):
+                if state.state in UNAVAILABLE_STATES:
                     continue
                 try:
                     date_key = state.last_updated.date()
@@ -489,7 +481,7 @@ class CalibrationSensor(BaseUtilitySensor):
             indoor_temp_default = 20.0  # Default if no sensor
             if indoor_states:
                 for state in indoor_states:
-                    if state.state in ("unknown", "unavailable"):
+                    if state.state in UNAVAILABLE_STATES:
                         continue
                     try:
                         date_key = state.last_updated.date()
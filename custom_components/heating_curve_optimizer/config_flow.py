@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+from functools import lru_cache
 from typing import Any
 
 from homeassistant import config_entries
@@ -74,8 +74,156 @@ STEP_PRICE_SETTINGS = "price_settings"
 STEP_BASIC = "basic"
 STEP_HEATING_CURVE_SETTINGS = "heating_curve_settings"
 
+# Energy, power, temperature and price sensor ids
+_SensorPools = tuple[list[str], list[str], list[str], list[str]]
 
-class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
+_ENERGY_CLASSES = frozenset({"energy", "gas"})
+_POWER_CLASSES = frozenset({"power", "energy"})
+_TEMPERATURE_UNITS = frozenset({"°C", "°F", "K"})
+
+_USER_OPTIONS = [
+    {"value": STEP_BASIC, "label": "Basic Settings"},
+    *({"value": t, "label": t.title()} for t in SOURCE_TYPES),
+    {"value": STEP_HEATING_CURVE_SETTINGS, "label": "Heating Curve Settings"},
+    {"value": STEP_PRICE_SETTINGS, "label": "Price Settings"},
+    {"value": "finish", "label": "Finish"},
+]
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SOURCE_TYPE): selector(
+            {
+                "select": {
+                    "options": _USER_OPTIONS,
+                    "mode": "dropdown",
+                    "custom_value": False,
+                }
+            }
+        )
+    }
+)
+
+_ENERGY_LABEL_SELECTOR = selector(
+    {
+        "select": {
+            "options": ENERGY_LABELS,
+            "mode": "dropdown",
+            "custom_value": False,
+        }
+    }
+)
+
+_VENTILATION_TYPE_SELECTOR = selector(
+    {
+        "select": {
+            "options": list(VENTILATION_TYPES.keys()),
+            "mode": "dropdown",
+            "translation_key": "ventilation_type",
+        }
+    }
+)
+
+
+def _classify_sensors(hass) -> _SensorPools:
+    """Return sorted energy, power, temperature and price sensors in one pass."""
+    energy: list[str] = []
+    power: list[str] = []
+    temperature: list[str] = []
+    prices: list[str] = []
+    for state in hass.states.async_all("sensor"):
+        entity_id = state.entity_id
+        attributes = state.attributes
+        device_class = attributes.get("device_class")
+        unit = attributes.get("unit_of_measurement")
+        if device_class in _ENERGY_CLASSES:
+            energy.append(entity_id)
+        if device_class in _POWER_CLASSES:
+            power.append(entity_id)
+        if device_class == "temperature" or unit in _TEMPERATURE_UNITS:
+            temperature.append(entity_id)
+        if device_class == "monetary" or unit == "€/kWh":
+            prices.append(entity_id)
+    energy.sort()
+    power.sort()
+    temperature.sort()
+    prices.sort()
+    return energy, power, temperature, prices
+
+
+@lru_cache(maxsize=32)
+def _price_schema(
+    prices: tuple[str, ...], consumption: str | None, production: str | None
+) -> vol.Schema:
+    """Build the price settings schema for the given sensors and defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_CONSUMPTION_PRICE_SENSOR, default=consumption): selector(
+                {
+                    "select": {
+                        "options": list(prices),
+                        "multiple": False,
+                        "mode": "dropdown",
+                    }
+                }
+            ),
+            vol.Required(CONF_PRODUCTION_PRICE_SENSOR, default=production): selector(
+                {
+                    "select": {
+                        "options": list(prices),
+                        "multiple": False,
+                        "mode": "dropdown",
+                    }
+                }
+            ),
+        }
+    )
+
+
+class _SensorFlowMixin:
+    """Sensor lookups and steps shared by the config and options flows."""
+
+    def _sensor_pools(self) -> _SensorPools:
+        """Return the classified sensors from the current states.
+
+        Rescanned on every step so renamed, swapped or reclassified sensors
+        show up; a flow step is not a hot path.
+        """
+        return _classify_sensors(self.hass)
+
+    async def async_step_price_settings(self, user_input=None) -> ConfigFlowResult:
+        if user_input is not None:
+            self.consumption_price_sensor = user_input[CONF_CONSUMPTION_PRICE_SENSOR]
+            self.production_price_sensor = user_input[CONF_PRODUCTION_PRICE_SENSOR]
+            self.price_settings = dict(user_input)
+            return await self.async_step_user()
+
+        _, _, _, all_prices = self._sensor_pools()
+        current_consumption_sensor = (
+            self.consumption_price_sensor
+            or self.price_settings.get(
+                CONF_CONSUMPTION_PRICE_SENSOR,
+                self.price_settings.get(CONF_PRICE_SENSOR, ""),
+            )
+        )
+        current_production_sensor = (
+            self.production_price_sensor
+            or self.price_settings.get(
+                CONF_PRODUCTION_PRICE_SENSOR,
+                current_consumption_sensor,
+            )
+        )
+
+        return self.async_show_form(
+            step_id=STEP_PRICE_SETTINGS,
+            data_schema=_price_schema(
+                tuple(all_prices), current_consumption_sensor, current_production_sensor
+            ),
+        )
+
+
+class HeatingCurveOptimizerConfigFlow(  # type: ignore[call-arg]
+    _SensorFlowMixin, config_entries.ConfigFlow, domain=DOMAIN
+):
     """Handle a config flow for Heating Curve Optimizer."""
 
     VERSION = 1
@@ -85,6 +233,7 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         self.context: ConfigFlowContext = {}
         self.configs: list[dict] = []
+        self._sources_by_type: dict[str | None, list[str]] = {}
         self.source_type: str | None = None
         self.sources: list[str] | None = None
         self.price_settings: dict[str, Any] = {}
@@ -117,13 +266,14 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.heating_curve_offset: float = DEFAULT_HEATING_CURVE_OFFSET
         self.heat_curve_min: float = DEFAULT_HEAT_CURVE_MIN
         self.heat_curve_max: float = DEFAULT_HEAT_CURVE_MAX
+        self._basic_schema_cache: tuple[tuple, vol.Schema] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> ConfigFlowResult:
-        await self.async_set_unique_id(DOMAIN)
         if self._async_current_entries():
             return self.async_abort(reason="already_configured")
+        await self.async_set_unique_id(DOMAIN)
         if user_input is not None:
             choice = user_input[CONF_SOURCE_TYPE]
             if choice == STEP_BASIC:
@@ -136,13 +286,13 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if self.area_m2 is None:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=self._schema_user(),
+                        data_schema=_USER_SCHEMA,
                         errors={"base": "missing_basic"},
                     )
                 if not self.configs:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=self._schema_user(),
+                        data_schema=_USER_SCHEMA,
                         errors={"base": "no_blocks"},
                     )
                 consumption_price_sensor = (
@@ -194,114 +344,27 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.source_type = choice
             return await self.async_step_select_sources()
 
-        return self.async_show_form(step_id="user", data_schema=self._schema_user())
-
-    def _schema_user(self) -> vol.Schema:
-        options = [{"value": STEP_BASIC, "label": "Basic Settings"}]
-        options.extend({"value": t, "label": t.title()} for t in SOURCE_TYPES)
-        options.append(
-            {"value": STEP_HEATING_CURVE_SETTINGS, "label": "Heating Curve Settings"}
-        )
-        options.append({"value": STEP_PRICE_SETTINGS, "label": "Price Settings"})
-        options.append({"value": "finish", "label": "Finish"})
-
-        return vol.Schema(
-            {
-                vol.Required(CONF_SOURCE_TYPE): selector(
-                    {
-                        "select": {
-                            "options": options,
-                            "mode": "dropdown",
-                            "custom_value": False,
-                        }
-                    }
-                )
-            }
-        )
-
-    async def _get_energy_sensors(self) -> list[str]:
-        return sorted(
-            [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") == "energy"
-                or state.attributes.get("device_class") == "gas"
-            ]
-        )
-
-    async def _get_power_sensors(self) -> list[str]:
-        return sorted(
-            [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") in ("power", "energy")
-            ]
-        )
-
-    async def _get_temperature_sensors(self) -> list[str]:
-        return sorted(
-            [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") == "temperature"
-                or state.attributes.get("unit_of_measurement") in ["°C", "°F", "K"]
-            ]
-        )
-
-    async def async_step_basic_options(self, user_input=None):
-        if user_input is not None:
-            self.area_m2 = float(user_input[CONF_AREA_M2])
-            self.energy_label = user_input[CONF_ENERGY_LABEL]
-            self.glass_east_m2 = float(user_input.get(CONF_GLASS_EAST_M2, 0))
-            self.glass_west_m2 = float(user_input.get(CONF_GLASS_WEST_M2, 0))
-            self.glass_south_m2 = float(user_input.get(CONF_GLASS_SOUTH_M2, 0))
-            self.glass_u_value = float(user_input.get(CONF_GLASS_U_VALUE, 1.2))
-            self.ventilation_type = user_input.get(
-                CONF_VENTILATION_TYPE, DEFAULT_VENTILATION_TYPE
-            )
-            self.ceiling_height = float(
-                user_input.get(CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT)
-            )
-            self.pv_east_wp = float(user_input.get(CONF_PV_EAST_WP, 0))
-            self.pv_south_wp = float(user_input.get(CONF_PV_SOUTH_WP, 0))
-            self.pv_west_wp = float(user_input.get(CONF_PV_WEST_WP, 0))
-            self.pv_tilt = float(user_input.get(CONF_PV_TILT, DEFAULT_PV_TILT))
-            self.indoor_temperature_sensor = user_input.get(
-                CONF_INDOOR_TEMPERATURE_SENSOR
-            )
-            self.power_consumption = user_input.get(CONF_POWER_CONSUMPTION)
-            return await self.async_step_user()
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
-        power_sensors = await self._get_power_sensors()
-        temp_sensors = await self._get_temperature_sensors()
+    def _basic_schema(self) -> vol.Schema:
+        """Return the basic settings schema, rebuilt only when sensors change."""
+        _, power_sensors, temp_sensors, _ = self._sensor_pools()
+        key = (tuple(temp_sensors), tuple(power_sensors))
+        cache = self._basic_schema_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
 
         schema = vol.Schema(
             {
                 vol.Required(CONF_AREA_M2): vol.Coerce(float),
-                vol.Required(CONF_ENERGY_LABEL): selector(
-                    {
-                        "select": {
-                            "options": ENERGY_LABELS,
-                            "mode": "dropdown",
-                            "custom_value": False,
-                        }
-                    }
-                ),
+                vol.Required(CONF_ENERGY_LABEL): _ENERGY_LABEL_SELECTOR,
                 vol.Optional(CONF_GLASS_EAST_M2, default=0.0): vol.Coerce(float),
                 vol.Optional(CONF_GLASS_WEST_M2, default=0.0): vol.Coerce(float),
                 vol.Optional(CONF_GLASS_SOUTH_M2, default=0.0): vol.Coerce(float),
                 vol.Optional(CONF_GLASS_U_VALUE, default=1.2): vol.Coerce(float),
                 vol.Optional(
                     CONF_VENTILATION_TYPE, default=DEFAULT_VENTILATION_TYPE
-                ): selector(
-                    {
-                        "select": {
-                            "options": list(VENTILATION_TYPES.keys()),
-                            "mode": "dropdown",
-                            "translation_key": "ventilation_type",
-                        }
-                    }
-                ),
+                ): _VENTILATION_TYPE_SELECTOR,
                 vol.Optional(
                     CONF_CEILING_HEIGHT, default=DEFAULT_CEILING_HEIGHT
                 ): vol.Coerce(float),
@@ -329,8 +392,36 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
             }
         )
+        self._basic_schema_cache = (key, schema)
+        return schema
 
-        return self.async_show_form(step_id=STEP_BASIC, data_schema=schema)
+    async def async_step_basic_options(self, user_input=None):
+        if user_input is not None:
+            self.area_m2 = float(user_input[CONF_AREA_M2])
+            self.energy_label = user_input[CONF_ENERGY_LABEL]
+            self.glass_east_m2 = float(user_input.get(CONF_GLASS_EAST_M2, 0))
+            self.glass_west_m2 = float(user_input.get(CONF_GLASS_WEST_M2, 0))
+            self.glass_south_m2 = float(user_input.get(CONF_GLASS_SOUTH_M2, 0))
+            self.glass_u_value = float(user_input.get(CONF_GLASS_U_VALUE, 1.2))
+            self.ventilation_type = user_input.get(
+                CONF_VENTILATION_TYPE, DEFAULT_VENTILATION_TYPE
+            )
+            self.ceiling_height = float(
+                user_input.get(CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT)
+            )
+            self.pv_east_wp = float(user_input.get(CONF_PV_EAST_WP, 0))
+            self.pv_south_wp = float(user_input.get(CONF_PV_SOUTH_WP, 0))
+            self.pv_west_wp = float(user_input.get(CONF_PV_WEST_WP, 0))
+            self.pv_tilt = float(user_input.get(CONF_PV_TILT, DEFAULT_PV_TILT))
+            self.indoor_temperature_sensor = user_input.get(
+                CONF_INDOOR_TEMPERATURE_SENSOR
+            )
+            self.power_consumption = user_input.get(CONF_POWER_CONSUMPTION)
+            return await self.async_step_user()
+
+        return self.async_show_form(
+            step_id=STEP_BASIC, data_schema=self._basic_schema()
+        )
 
     async def async_step_heating_curve_settings(self, user_input=None):
         if user_input is not None:
@@ -373,7 +464,7 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
             return await self.async_step_user()
 
-        temp_sensors = await self._get_temperature_sensors()
+        _, _, temp_sensors, _ = self._sensor_pools()
 
         schema = vol.Schema(
             {
@@ -445,88 +536,7 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_basic(self, user_input=None):
-        if user_input is not None:
-            self.area_m2 = float(user_input[CONF_AREA_M2])
-            self.energy_label = user_input[CONF_ENERGY_LABEL]
-            self.glass_east_m2 = float(user_input.get(CONF_GLASS_EAST_M2, 0))
-            self.glass_west_m2 = float(user_input.get(CONF_GLASS_WEST_M2, 0))
-            self.glass_south_m2 = float(user_input.get(CONF_GLASS_SOUTH_M2, 0))
-            self.glass_u_value = float(user_input.get(CONF_GLASS_U_VALUE, 1.2))
-            self.ventilation_type = user_input.get(
-                CONF_VENTILATION_TYPE, DEFAULT_VENTILATION_TYPE
-            )
-            self.ceiling_height = float(
-                user_input.get(CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT)
-            )
-            self.pv_east_wp = float(user_input.get(CONF_PV_EAST_WP, 0))
-            self.pv_south_wp = float(user_input.get(CONF_PV_SOUTH_WP, 0))
-            self.pv_west_wp = float(user_input.get(CONF_PV_WEST_WP, 0))
-            self.pv_tilt = float(user_input.get(CONF_PV_TILT, DEFAULT_PV_TILT))
-            self.indoor_temperature_sensor = user_input.get(
-                CONF_INDOOR_TEMPERATURE_SENSOR
-            )
-            self.power_consumption = user_input.get(CONF_POWER_CONSUMPTION)
-            return await self.async_step_user()
-
-        power_sensors = await self._get_power_sensors()
-        temp_sensors = await self._get_temperature_sensors()
-
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_AREA_M2): vol.Coerce(float),
-                vol.Required(CONF_ENERGY_LABEL): selector(
-                    {
-                        "select": {
-                            "options": ENERGY_LABELS,
-                            "mode": "dropdown",
-                            "custom_value": False,
-                        }
-                    }
-                ),
-                vol.Optional(CONF_GLASS_EAST_M2, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_GLASS_WEST_M2, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_GLASS_SOUTH_M2, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_GLASS_U_VALUE, default=1.2): vol.Coerce(float),
-                vol.Optional(
-                    CONF_VENTILATION_TYPE, default=DEFAULT_VENTILATION_TYPE
-                ): selector(
-                    {
-                        "select": {
-                            "options": list(VENTILATION_TYPES.keys()),
-                            "mode": "dropdown",
-                            "translation_key": "ventilation_type",
-                        }
-                    }
-                ),
-                vol.Optional(
-                    CONF_CEILING_HEIGHT, default=DEFAULT_CEILING_HEIGHT
-                ): vol.Coerce(float),
-                vol.Optional(CONF_PV_EAST_WP, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_PV_SOUTH_WP, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_PV_WEST_WP, default=0.0): vol.Coerce(float),
-                vol.Optional(CONF_PV_TILT, default=DEFAULT_PV_TILT): vol.Coerce(float),
-                vol.Optional(CONF_INDOOR_TEMPERATURE_SENSOR): selector(
-                    {
-                        "select": {
-                            "options": temp_sensors,
-                            "multiple": False,
-                            "mode": "dropdown",
-                        }
-                    }
-                ),
-                vol.Optional(CONF_POWER_CONSUMPTION): selector(
-                    {
-                        "select": {
-                            "options": power_sensors,
-                            "multiple": False,
-                            "mode": "dropdown",
-                        }
-                    }
-                ),
-            }
-        )
-
-        return self.async_show_form(step_id=STEP_BASIC, data_schema=schema)
+        return await self.async_step_basic_options(user_input)
 
     async def async_step_select_sources(self, user_input=None) -> ConfigFlowResult:
         if user_input is not None:
@@ -550,19 +560,12 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 # Add new config
                 self.configs.append(new_config)
+            self._sources_by_type[self.source_type] = self.sources
             return await self.async_step_user()
 
-        all_sensors = await self._get_energy_sensors()
+        all_sensors, _, _, _ = self._sensor_pools()
 
-        last = next(
-            (
-                block
-                for block in reversed(self.configs)
-                if block[CONF_SOURCE_TYPE] == self.source_type
-            ),
-            None,
-        )
-        default_sources = last[CONF_SOURCES] if last else []
+        default_sources = self._sources_by_type.get(self.source_type, [])
 
         return self.async_show_form(
             step_id=STEP_SELECT_SOURCES,
@@ -581,64 +584,6 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
         )
 
-    async def async_step_price_settings(self, user_input=None) -> ConfigFlowResult:
-        if user_input is not None:
-            self.consumption_price_sensor = user_input[CONF_CONSUMPTION_PRICE_SENSOR]
-            self.production_price_sensor = user_input[CONF_PRODUCTION_PRICE_SENSOR]
-            self.price_settings = dict(user_input)
-            return await self.async_step_user()
-
-        all_prices = [
-            state.entity_id
-            for state in self.hass.states.async_all("sensor")
-            if state.attributes.get("device_class") == "monetary"
-            or state.attributes.get("unit_of_measurement") == "€/kWh"
-        ]
-        current_consumption_sensor = (
-            self.consumption_price_sensor
-            or self.price_settings.get(
-                CONF_CONSUMPTION_PRICE_SENSOR,
-                self.price_settings.get(CONF_PRICE_SENSOR, ""),
-            )
-        )
-        current_production_sensor = (
-            self.production_price_sensor
-            or self.price_settings.get(
-                CONF_PRODUCTION_PRICE_SENSOR,
-                current_consumption_sensor,
-            )
-        )
-
-        schema_fields: dict[Any, Any] = {
-            vol.Required(
-                CONF_CONSUMPTION_PRICE_SENSOR, default=current_consumption_sensor
-            ): selector(
-                {
-                    "select": {
-                        "options": all_prices,
-                        "multiple": False,
-                        "mode": "dropdown",
-                    }
-                }
-            ),
-            vol.Required(
-                CONF_PRODUCTION_PRICE_SENSOR, default=current_production_sensor
-            ): selector(
-                {
-                    "select": {
-                        "options": all_prices,
-                        "multiple": False,
-                        "mode": "dropdown",
-                    }
-                }
-            ),
-        }
-
-        return self.async_show_form(
-            step_id=STEP_PRICE_SETTINGS,
-            data_schema=vol.Schema(schema_fields),
-        )
-
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -647,7 +592,9 @@ class HeatingCurveOptimizerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return HeatingCurveOptimizerOptionsFlowHandler(config_entry)
 
 
-class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
+class HeatingCurveOptimizerOptionsFlowHandler(
+    _SensorFlowMixin, config_entries.OptionsFlow
+):
     """Handle updates to a config entry (options)."""
 
     def __init__(self, config_entry):
@@ -656,6 +603,9 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_CONFIGS, config_entry.data.get(CONF_CONFIGS, [])
             )
         )
+        self._sources_by_type: dict[str | None, list[str]] = {
+            cfg[CONF_SOURCE_TYPE]: cfg[CONF_SOURCES] for cfg in self.configs
+        }
 
         def _get(key: str, default=None):
             return config_entry.options.get(key, config_entry.data.get(key, default))
@@ -693,12 +643,7 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
         )
         self.heat_curve_min = _get(CONF_HEAT_CURVE_MIN, DEFAULT_HEAT_CURVE_MIN)
         self.heat_curve_max = _get(CONF_HEAT_CURVE_MAX, DEFAULT_HEAT_CURVE_MAX)
-        self.price_settings = copy.deepcopy(
-            config_entry.options.get(
-                CONF_PRICE_SETTINGS,
-                {},
-            )
-        )
+        self.price_settings = dict(config_entry.options.get(CONF_PRICE_SETTINGS, {}))
         self.consumption_price_sensor = _get(CONF_CONSUMPTION_PRICE_SENSOR)
         self.production_price_sensor = _get(CONF_PRODUCTION_PRICE_SENSOR)
         price_sensor = _get(CONF_PRICE_SENSOR)
@@ -725,25 +670,6 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
         self.source_type: str | None = None
         self.sources: list[str] | None = None
 
-    async def _get_energy_sensors(self) -> list[str]:
-        return sorted(
-            [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") == "energy"
-                or state.attributes.get("device_class") == "gas"
-            ]
-        )
-
-    async def _get_power_sensors(self) -> list[str]:
-        return sorted(
-            [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") in ("power", "energy")
-            ]
-        )
-
     async def async_step_init(self, user_input=None):
         return await self.async_step_user()
 
@@ -760,13 +686,13 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
                 if self.area_m2 is None:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=self._schema_user(),
+                        data_schema=_USER_SCHEMA,
                         errors={"base": "missing_basic"},
                     )
                 if not self.configs:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=self._schema_user(),
+                        data_schema=_USER_SCHEMA,
                         errors={"base": "no_blocks"},
                     )
                 consumption_price_sensor = (
@@ -818,30 +744,7 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
             self.source_type = choice
             return await self.async_step_select_sources()
 
-        return self.async_show_form(step_id="user", data_schema=self._schema_user())
-
-    def _schema_user(self) -> vol.Schema:
-        options = [{"value": STEP_BASIC, "label": "Basic Settings"}]
-        options.extend({"value": t, "label": t.title()} for t in SOURCE_TYPES)
-        options.append(
-            {"value": STEP_HEATING_CURVE_SETTINGS, "label": "Heating Curve Settings"}
-        )
-        options.append({"value": STEP_PRICE_SETTINGS, "label": "Price Settings"})
-        options.append({"value": "finish", "label": "Finish"})
-
-        return vol.Schema(
-            {
-                vol.Required(CONF_SOURCE_TYPE): selector(
-                    {
-                        "select": {
-                            "options": options,
-                            "mode": "dropdown",
-                            "custom_value": False,
-                        }
-                    }
-                )
-            }
-        )
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     async def async_step_basic(self, user_input=None):
         if user_input is not None:
@@ -867,23 +770,14 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
             self.power_consumption = user_input.get(CONF_POWER_CONSUMPTION)
             return await self.async_step_user()
 
-        power_sensors = await self._get_power_sensors()
-        temp_sensors = await HeatingCurveOptimizerConfigFlow._get_temperature_sensors(
-            self
-        )
+        _, power_sensors, temp_sensors, _ = self._sensor_pools()
 
         schema = vol.Schema(
             {
                 vol.Required(CONF_AREA_M2, default=self.area_m2): vol.Coerce(float),
-                vol.Required(CONF_ENERGY_LABEL, default=self.energy_label): selector(
-                    {
-                        "select": {
-                            "options": ENERGY_LABELS,
-                            "mode": "dropdown",
-                            "custom_value": False,
-                        }
-                    }
-                ),
+                vol.Required(
+                    CONF_ENERGY_LABEL, default=self.energy_label
+                ): _ENERGY_LABEL_SELECTOR,
                 vol.Optional(
                     CONF_GLASS_EAST_M2, default=self.glass_east_m2 or 0.0
                 ): vol.Coerce(float),
@@ -899,15 +793,7 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_VENTILATION_TYPE,
                     default=self.ventilation_type or DEFAULT_VENTILATION_TYPE,
-                ): selector(
-                    {
-                        "select": {
-                            "options": list(VENTILATION_TYPES.keys()),
-                            "mode": "dropdown",
-                            "translation_key": "ventilation_type",
-                        }
-                    }
-                ),
+                ): _VENTILATION_TYPE_SELECTOR,
                 vol.Optional(
                     CONF_CEILING_HEIGHT,
                     default=self.ceiling_height or DEFAULT_CEILING_HEIGHT,
@@ -993,9 +879,7 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
             )
             return await self.async_step_user()
 
-        temp_sensors = await HeatingCurveOptimizerConfigFlow._get_temperature_sensors(
-            self
-        )
+        _, _, temp_sensors, _ = self._sensor_pools()
 
         schema = vol.Schema(
             {
@@ -1088,23 +972,12 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
             else:
                 # Add new config
                 self.configs.append(new_config)
+            self._sources_by_type[self.source_type] = self.sources
             return await self.async_step_user()
 
-        all_sensors = [
-            state.entity_id
-            for state in self.hass.states.async_all("sensor")
-            if state.attributes.get("device_class") == "energy"
-        ]
+        all_sensors, _, _, _ = self._sensor_pools()
 
-        last = next(
-            (
-                block
-                for block in reversed(self.configs)
-                if block[CONF_SOURCE_TYPE] == self.source_type
-            ),
-            None,
-        )
-        default_sources = last[CONF_SOURCES] if last else []
+        default_sources = self._sources_by_type.get(self.source_type, [])
 
         return self.async_show_form(
             step_id=STEP_SELECT_SOURCES,
@@ -1122,61 +995,3 @@ class HeatingCurveOptimizerOptionsFlowHandler(config_entries.OptionsFlow):
                 }
             ),
         )
-
-    async def async_step_price_settings(self, user_input=None):
-        if user_input is not None:
-            self.consumption_price_sensor = user_input[CONF_CONSUMPTION_PRICE_SENSOR]
-            self.production_price_sensor = user_input[CONF_PRODUCTION_PRICE_SENSOR]
-            self.price_settings = dict(user_input)
-            return await self.async_step_user()
-
-        all_prices = [
-            state.entity_id
-            for state in self.hass.states.async_all("sensor")
-            if state.attributes.get("device_class") == "monetary"
-            or state.attributes.get("unit_of_measurement") == "€/kWh"
-        ]
-        current_consumption_sensor = (
-            self.consumption_price_sensor
-            or self.price_settings.get(
-                CONF_CONSUMPTION_PRICE_SENSOR,
-                self.price_settings.get(CONF_PRICE_SENSOR, ""),
-            )
-        )
-        current_production_sensor = (
-            self.production_price_sensor
-            or self.price_settings.get(
-                CONF_PRODUCTION_PRICE_SENSOR,
-                current_consumption_sensor,
-            )
-        )
-
-        schema_fields = {
-            vol.Required(
-                CONF_CONSUMPTION_PRICE_SENSOR, default=current_consumption_sensor
-            ): selector(
-                {
-                    "select": {
-                        "options": all_prices,
-                        "multiple": False,
-                        "mode": "dropdown",
-                    }
-                }
-            ),
-            vol.Required(
-                CONF_PRODUCTION_PRICE_SENSOR, default=current_production_sensor
-            ): selector(
-                {
-                    "select": {
-                        "options": all_prices,
-                        "multiple": False,
-                        "mode": "dropdown",
-                    }
-                }
-            ),
-        }
-
-        return self.async_show_form(
-            step_id=STEP_PRICE_SETTINGS,
-            data_schema=vol.Schema(schema_fields),
-        )
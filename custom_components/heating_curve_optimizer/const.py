@@ -1,5 +1,9 @@
 """Constants for the Heating Curve Optimizer integration."""
 
+from functools import lru_cache
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+
 # Domain of the integration
 DOMAIN = "heating_curve_optimizer"
 DOMAIN_ABBREVIATION = "HCO"
@@ -7,6 +11,14 @@ DOMAIN_ABBREVIATION = "HCO"
 # Supported platforms for this integration
 PLATFORMS = ["sensor", "binary_sensor"]
 
+# Source states that carry no usable value
+UNAVAILABLE_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
+
+# Units of measurement shared by the sensors
+UNIT_CELSIUS = "°C"
+UNIT_KWH = "kWh"
+UNIT_EUR = "€"
+
 # Configuration keys
 CONF_SOURCE_TYPE = "source_type"
 CONF_SOURCES = "sources"
@@ -168,6 +180,9 @@ U_VALUE_MAP = {
 }
 
 
+# Building parameters come from the static config entry, so results are
+# memoized; the heat calculation coordinator asks for them on every refresh.
+@lru_cache(maxsize=32)
 def calculate_ventilation_htc(
     area_m2: float,
     ventilation_type: str = DEFAULT_VENTILATION_TYPE,
@@ -215,6 +230,7 @@ def calculate_ventilation_htc(
     return h_v
 
 
+@lru_cache(maxsize=32)
 def calculate_htc_from_energy_label(
     energy_label: str,
     area_m2: float,
@@ -11,11 +11,11 @@ import aiohttp
 from homeassistant.core import HomeAssistant, Event
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import (
-    DataUpdateCoordinator,
+    TimestampDataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_AREA_M2,
@@ -55,14 +55,32 @@ from .const import (
     DEFAULT_PV_TILT,
     INDOOR_TEMPERATURE,
     calculate_htc_from_energy_label,
+    UNAVAILABLE_STATES,
+)
+from .helpers import (
+    extract_price_forecast_with_interval,
+    price_forecast_key,
+    same_price_forecast_key,
 )
-from .helpers import extract_price_forecast_with_interval
 from .optimizer import optimize_offsets
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class WeatherDataCoordinator(DataUpdateCoordinator):
+# Share of the radiation reaching each orientation; rough approximations
+# for Netherlands latitude
+_WINDOW_ORIENTATION_FACTORS = {
+    "east": 0.6,  # Morning sun
+    "south": 1.0,  # Maximum sun exposure
+    "west": 0.6,  # Afternoon sun
+}
+_PV_ORIENTATION_FACTORS = {
+    "east": 0.65,
+    "south": 1.0,
+    "west": 0.65,
+}
+
+
+class WeatherDataCoordinator(TimestampDataUpdateCoordinator):
     """Coordinator for weather and radiation data from open-meteo.com."""
 
     def __init__(self, hass: HomeAssistant):
@@ -72,6 +90,7 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Weather Data",
             update_interval=timedelta(minutes=30),
+            always_update=False,
         )
         self.latitude = hass.config.latitude
         self.longitude = hass.config.longitude
@@ -97,7 +116,8 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
             ) as resp:
                 if resp.status != 200:
                     raise UpdateFailed(f"API returned status {resp.status}")
-                data = await resp.json()
+                # HA's orjson-backed loader parses the payload faster
+                data = await resp.json(loads=json_loads)
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise UpdateFailed(f"Error fetching weather data: {err}")
 
@@ -127,23 +147,19 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
                 start_idx = i
                 break
 
-        # Extract next 48 hours (2 days)
-        temp_forecast = [float(v) for v in temps[start_idx : start_idx + 48]]
-        humidity_forecast = (
-            [float(v) for v in humidity[start_idx : start_idx + 48]] if humidity else []
-        )
-        radiation_forecast = (
-            [float(v) for v in radiation[start_idx : start_idx + 48]]
-            if radiation
-            else []
-        )
+        # Extract next 48 hours (2 days), converting and rounding in one pass
+        end_idx = start_idx + 48
+        temp_forecast = [round(float(v), 2) for v in temps[start_idx:end_idx]]
 
         result = {
             "current_temperature": round(current_temp, 2),
-            "temperature_forecast": [round(v, 2) for v in temp_forecast],
-            "humidity_forecast": [round(v, 1) for v in humidity_forecast],
-            "radiation_forecast": [round(v, 1) for v in radiation_forecast],
-            "timestamp": dt_util.utcnow(),
+            "temperature_forecast": temp_forecast,
+            "humidity_forecast": [
+                round(float(v), 1) for v in humidity[start_idx:end_idx]
+            ],
+            "radiation_forecast": [
+                round(float(v), 1) for v in radiation[start_idx:end_idx]
+            ],
         }
 
         _LOGGER.debug(
@@ -155,7 +171,7 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
         return result
 
 
-class HeatCalculationCoordinator(DataUpdateCoordinator):
+class HeatCalculationCoordinator(TimestampDataUpdateCoordinator):
     """Coordinator for heat loss, solar gain, and PV production calculations."""
 
     def __init__(
@@ -170,11 +186,37 @@ class HeatCalculationCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Heat Calculations",
             update_interval=timedelta(minutes=5),
+            always_update=False,
         )
         self.weather_coordinator = weather_coordinator
         self.config = config
         self._indoor_temp_sensor = config.get(CONF_INDOOR_TEMPERATURE_SENSOR)
         self._unsub = None
+        # The config is fixed for the lifetime of the coordinator (options
+        # changes reload the entry), so derive the HTC once
+        self._htc_kw = self._calculate_htc_kw(config)
+        self._solar_gain_factor = self._calculate_solar_gain_factor(config)
+        self._pv_production_factor = self._calculate_pv_production_factor(config)
+
+    @staticmethod
+    def _calculate_htc_kw(config: dict[str, Any]) -> float | None:
+        """Return the heat transfer coefficient in kW/K, or None if unset."""
+        area_m2 = config.get(CONF_AREA_M2)
+        energy_label = config.get(CONF_ENERGY_LABEL)
+        if not area_m2 or not energy_label:
+            return None
+
+        htc = calculate_htc_from_energy_label(
+            energy_label,
+            area_m2,
+            ventilation_type=config.get(
+                CONF_VENTILATION_TYPE, DEFAULT_VENTILATION_TYPE
+            ),
+            ceiling_height=float(
+                config.get(CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT)
+            ),
+        )
+        return htc / 1000  # W/K to kW/K
 
     async def async_setup(self) -> None:
         """Set up event tracking for indoor temperature changes."""
@@ -223,62 +265,37 @@ class HeatCalculationCoordinator(DataUpdateCoordinator):
         if not weather_data:
             raise UpdateFailed("No weather data available")
 
-        # Get configuration
-        area_m2 = self.config.get(CONF_AREA_M2)
-        energy_label = self.config.get(CONF_ENERGY_LABEL)
-
-        if not area_m2 or not energy_label:
+        htc_kw = self._htc_kw
+        if htc_kw is None:
             raise UpdateFailed("Missing area or energy label configuration")
 
         # Get indoor temperature
         indoor_temp = INDOOR_TEMPERATURE
         if self._indoor_temp_sensor:
             indoor_state = self.hass.states.get(self._indoor_temp_sensor)
-            if indoor_state and indoor_state.state not in ("unknown", "unavailable"):
+            if indoor_state and indoor_state.state not in UNAVAILABLE_STATES:
                 try:
                     indoor_temp = float(indoor_state.state)
                 except (ValueError, TypeError):
                     pass
 
-        # Calculate HTC (Heat Transfer Coefficient)
-        ventilation_type = self.config.get(
-            CONF_VENTILATION_TYPE, DEFAULT_VENTILATION_TYPE
-        )
-        ceiling_height = float(
-            self.config.get(CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT)
-        )
-
-        htc = calculate_htc_from_energy_label(
-            energy_label,
-            area_m2,
-            ventilation_type=ventilation_type,
-            ceiling_height=ceiling_height,
-        )
-
         # Calculate current heat loss
         outdoor_temp = weather_data["current_temperature"]
-        heat_loss = htc * (indoor_temp - outdoor_temp) / 1000  # Convert to kW
+        heat_loss = htc_kw * (indoor_temp - outdoor_temp)
 
         # Calculate heat loss forecast
         heat_loss_forecast = [
-            htc * (indoor_temp - t) / 1000 for t in weather_data["temperature_forecast"]
+            htc_kw * (indoor_temp - t) for t in weather_data["temperature_forecast"]
         ]
 
-        # Calculate solar gain
-        solar_gain, solar_forecast = await self.hass.async_add_executor_job(
-            self._calculate_solar_gain,
-            weather_data["radiation_forecast"],
-        )
-
-        # Calculate PV production
-        pv_forecast = await self.hass.async_add_executor_job(
-            self._calculate_pv_production,
-            weather_data["radiation_forecast"],
-        )
+        # Solar gain and PV production are one multiplication per forecast
+        # hour, far cheaper than a round trip through the executor
+        radiation_forecast = weather_data["radiation_forecast"]
+        solar_gain, solar_forecast = self._calculate_solar_gain(radiation_forecast)
+        pv_forecast = self._calculate_pv_production(radiation_forecast)
 
         # Calculate net heat loss (heat loss - solar gain)
         net_heat_loss = heat_loss - solar_gain
-        net_forecast = [h - s for h, s in zip(heat_loss_forecast, solar_forecast)]
 
         result = {
             "heat_loss": round(heat_loss, 3),
@@ -287,10 +304,12 @@ class HeatCalculationCoordinator(DataUpdateCoordinator):
             "solar_gain_forecast": [round(v, 3) for v in solar_forecast],
             "pv_production_forecast": [round(v, 3) for v in pv_forecast],
             "net_heat_loss": round(net_heat_loss, 3),
-            "net_heat_loss_forecast": [round(v, 3) for v in net_forecast],
+            # Subtracted and rounded in one pass, without an interim list
+            "net_heat_loss_forecast": [
+                round(h - s, 3) for h, s in zip(heat_loss_forecast, solar_forecast)
+            ],
             "outdoor_temperature": outdoor_temp,
             "indoor_temperature": indoor_temp,
-            "timestamp": dt_util.utcnow(),
         }
 
         _LOGGER.debug(
@@ -302,58 +321,33 @@ class HeatCalculationCoordinator(DataUpdateCoordinator):
 
         return result
 
-    def _calculate_solar_gain(
-        self, radiation_forecast: list[float]
-    ) -> tuple[float, list[float]]:
-        """Calculate solar gain through windows (blocking call)."""
-        glass_east = float(self.config.get(CONF_GLASS_EAST_M2, 0))
-        glass_south = float(self.config.get(CONF_GLASS_SOUTH_M2, 0))
-        glass_west = float(self.config.get(CONF_GLASS_WEST_M2, 0))
-        glass_u = float(self.config.get(CONF_GLASS_U_VALUE, 1.2))
-
-        total_glass = glass_east + glass_south + glass_west
-
-        if total_glass == 0 or not radiation_forecast:
-            return 0.0, [0.0] * len(radiation_forecast)
+    @staticmethod
+    def _calculate_solar_gain_factor(config: dict[str, Any]) -> float:
+        """Return the window solar gain in kW per W/m² of radiation."""
+        glass_east = float(config.get(CONF_GLASS_EAST_M2, 0))
+        glass_south = float(config.get(CONF_GLASS_SOUTH_M2, 0))
+        glass_west = float(config.get(CONF_GLASS_WEST_M2, 0))
+        glass_u = float(config.get(CONF_GLASS_U_VALUE, 1.2))
 
         # SHGC (Solar Heat Gain Coefficient) approximation
         # Lower U-value glass typically has lower SHGC
         shgc = max(0.3, 0.7 - (glass_u - 0.8) * 0.2)
 
-        # Orientation factors (how much radiation reaches each direction)
-        # These are rough approximations for Netherlands latitude
-        orientation_factors = {
-            "east": 0.6,  # Morning sun
-            "south": 1.0,  # Maximum sun exposure
-            "west": 0.6,  # Afternoon sun
-        }
-
-        solar_forecast = []
-        for radiation in radiation_forecast:
-            # Calculate solar gain for each orientation
-            gain = (
-                glass_east * radiation * orientation_factors["east"] * shgc
-                + glass_south * radiation * orientation_factors["south"] * shgc
-                + glass_west * radiation * orientation_factors["west"] * shgc
-            ) / 1000  # Convert W to kW
-
-            solar_forecast.append(max(0.0, gain))
-
-        current_solar = solar_forecast[0] if solar_forecast else 0.0
-
-        return current_solar, solar_forecast
-
-    def _calculate_pv_production(self, radiation_forecast: list[float]) -> list[float]:
-        """Calculate PV production forecast (blocking call)."""
-        pv_east = float(self.config.get(CONF_PV_EAST_WP, 0))
-        pv_south = float(self.config.get(CONF_PV_SOUTH_WP, 0))
-        pv_west = float(self.config.get(CONF_PV_WEST_WP, 0))
-        pv_tilt = float(self.config.get(CONF_PV_TILT, DEFAULT_PV_TILT))
-
-        total_pv = pv_east + pv_south + pv_west
-
-        if total_pv == 0 or not radiation_forecast:
-            return [0.0] * len(radiation_forecast)
+        # Gain is linear in radiation, so fold the per-orientation glass area,
+        # SHGC and W to kW conversion into one factor per hour
+        return (
+            glass_east * _WINDOW_ORIENTATION_FACTORS["east"]
+            + glass_south * _WINDOW_ORIENTATION_FACTORS["south"]
+            + glass_west * _WINDOW_ORIENTATION_FACTORS["west"]
+        ) * (shgc / 1000)
+
+    @staticmethod
+    def _calculate_pv_production_factor(config: dict[str, Any]) -> float:
+        """Return the PV production in kW per W/m² of radiation."""
+        pv_east = float(config.get(CONF_PV_EAST_WP, 0))
+        pv_south = float(config.get(CONF_PV_SOUTH_WP, 0))
+        pv_west = float(config.get(CONF_PV_WEST_WP, 0))
+        pv_tilt = float(config.get(CONF_PV_TILT, DEFAULT_PV_TILT))
 
         # System efficiency (inverter + wiring + temperature losses)
         system_efficiency = 0.85
@@ -362,36 +356,44 @@ class HeatCalculationCoordinator(DataUpdateCoordinator):
         # Optimal tilt for Netherlands is ~35°
         tilt_factor = 1.0 if pv_tilt == 35 else max(0.7, 1.0 - abs(pv_tilt - 35) * 0.01)
 
-        # Orientation factors for PV panels
-        orientation_factors = {
-            "east": 0.65,
-            "south": 1.0,
-            "west": 0.65,
-        }
+        # Formula: Power (W) = Wp * (radiation / 1000) * efficiency
+        # radiation is in W/m², 1000 W/m² is STC (Standard Test Conditions).
+        # Everything except the radiation is constant, so fold it into one
+        # factor: first /1000 for STC, second for W to kW.
+        return (
+            (
+                pv_east * _PV_ORIENTATION_FACTORS["east"]
+                + pv_south * _PV_ORIENTATION_FACTORS["south"]
+                + pv_west * _PV_ORIENTATION_FACTORS["west"]
+            )
+            * tilt_factor
+            * system_efficiency
+            / 1000
+            / 1000
+        )
 
-        pv_forecast = []
-        for radiation in radiation_forecast:
-            # Calculate production for each orientation
-            # Formula: Power (W) = Wp * (radiation / 1000) * efficiency
-            # radiation is in W/m², 1000 W/m² is STC (Standard Test Conditions)
-            production = (
-                (
-                    pv_east * radiation * orientation_factors["east"]
-                    + pv_south * radiation * orientation_factors["south"]
-                    + pv_west * radiation * orientation_factors["west"]
-                )
-                * tilt_factor
-                * system_efficiency
-                / 1000
-                / 1000
-            )  # First /1000 for STC, second for W to kW
+    def _calculate_solar_gain(
+        self, radiation_forecast: list[float]
+    ) -> tuple[float, list[float]]:
+        """Calculate solar gain through windows."""
+        gain_factor = self._solar_gain_factor
+        solar_forecast = [
+            max(0.0, radiation * gain_factor) for radiation in radiation_forecast
+        ]
 
-            pv_forecast.append(max(0.0, production))
+        current_solar = solar_forecast[0] if solar_forecast else 0.0
 
-        return pv_forecast
+        return current_solar, solar_forecast
+
+    def _calculate_pv_production(self, radiation_forecast: list[float]) -> list[float]:
+        """Calculate PV production forecast."""
+        production_factor = self._pv_production_factor
+        return [
+            max(0.0, radiation * production_factor) for radiation in radiation_forecast
+        ]
 
 
-class OptimizationCoordinator(DataUpdateCoordinator):
+class OptimizationCoordinator(TimestampDataUpdateCoordinator):
     """Coordinator for heating curve optimization using dynamic programming."""
 
     def __init__(
@@ -406,12 +408,14 @@ class OptimizationCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Heating Optimization",
             update_interval=timedelta(minutes=15),
+            always_update=False,
         )
         self.heat_coordinator = heat_coordinator
         self.config = config
         self._price_sensor = config.get(CONF_CONSUMPTION_PRICE_SENSOR)
         self._unsub = None
         self._last_price = None
+        self._price_forecast_cache: tuple[tuple, tuple[list[float], int]] | None = None
 
     async def async_setup(self) -> None:
         """Set up event tracking for price changes."""
@@ -471,12 +475,18 @@ class OptimizationCoordinator(DataUpdateCoordinator):
             raise UpdateFailed("No price sensor configured")
 
         price_state = self.hass.states.get(self._price_sensor)
-        if not price_state or price_state.state in ("unknown", "unavailable"):
+        if not price_state or price_state.state in UNAVAILABLE_STATES:
             raise UpdateFailed("Price sensor not available")
 
-        price_forecast, price_interval = extract_price_forecast_with_interval(
-            price_state
-        )
+        price_key = price_forecast_key(price_state)
+        cache = self._price_forecast_cache
+        if cache is not None and same_price_forecast_key(cache[0], price_key):
+            price_forecast, price_interval = cache[1]
+        else:
+            price_forecast, price_interval = extract_price_forecast_with_interval(
+                price_state
+            )
+            self._price_forecast_cache = (price_key, (price_forecast, price_interval))
 
         if not price_forecast:
             # Fallback to current price
@@ -681,7 +691,6 @@ class OptimizationCoordinator(DataUpdateCoordinator):
                 "prices": [round(p, 5) for p in price_limited],
                 "demand_forecast": [round(d, 3) for d in demand_limited],
                 "outdoor_forecast": [round(t, 1) for t in temp_limited],
-                "timestamp": dt_util.utcnow(),
             }
 
         except Exception as err:
@@ -692,6 +701,5 @@ class OptimizationCoordinator(DataUpdateCoordinator):
                 "optimized_offsets": [0.0],
                 "buffer_evolution": [0.0],
                 "total_cost": 0.0,
-                "timestamp": dt_util.utcnow(),
                 "error": str(err),
             }
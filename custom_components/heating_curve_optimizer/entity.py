@@ -9,13 +9,65 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.helpers.entity import DeviceInfo
 
+from .const import UNAVAILABLE_STATES
+
 
 import logging
+from functools import cache
+from collections.abc import Callable
+from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Restored states that carry no value and are skipped without parsing
+_UNRESTORABLE_STATES = UNAVAILABLE_STATES | {""}
+
+
+@cache
+def translation_key_from_name(name: str) -> str:
+    """Return the translation key derived from a sensor name."""
+
+    return name.lower().replace(" ", "_").replace(".", "_")
+
+
+# Shared immutable default for missing forecast lists
+EMPTY_FORECAST: tuple = ()
+
+
+class CachedAttributesMixin:
+    """Build extra state attributes once per coordinator data object.
+
+    Coordinators publish a new data dict on every refresh, so an identical
+    object means the attributes are unchanged. Subclasses implement
+    ``_build_attributes``.
+    """
+
+    _attrs_cache: tuple[dict[str, Any], dict[str, Any]] | None = None
+    # Builds the attributes from the coordinator data
+    _build_attributes: Callable[[dict[str, Any]], dict[str, Any]]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        data = self.coordinator.data
+        if not data:
+            return {}
+
+        cache = self._attrs_cache
+        if cache is not None and cache[0] is data:
+            return cache[1]
+
+        attrs = self._build_attributes(data)
+        self._attrs_cache = (data, attrs)
+        return attrs
+
 
 class BaseUtilitySensor(SensorEntity, RestoreEntity):
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_value: float = 0.0
+    _attr_available = True
+    # Value and availability of the last set_value write
+    _written: tuple[float, bool] | None = None
+
     def __init__(
         self,
         name: str | None,
@@ -36,9 +88,6 @@ class BaseUtilitySensor(SensorEntity, RestoreEntity):
         if device_class is not None and not isinstance(device_class, SensorDeviceClass):
             device_class = SensorDeviceClass(device_class)
         self._attr_device_class = device_class
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_native_value = 0.0
-        self._attr_available = True
         self._attr_icon = icon
         self._attr_entity_registry_enabled_default = visible
         self._attr_device_info = device
@@ -46,25 +95,32 @@ class BaseUtilitySensor(SensorEntity, RestoreEntity):
 
     @property
     def native_value(self) -> float:
-        return float(round(float(self._attr_native_value or 0.0), 8))
+        value = self._attr_native_value
+        if value is None:
+            return 0.0
+        return round(value, 8)
 
     async def async_added_to_hass(self):
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state not in (
-            "unknown",
-            "unavailable",
-        ):
-            try:
-                self._attr_native_value = float(last_state.state)
-            except ValueError:
-                self._attr_native_value = 0.0
+        if last_state is None or last_state.state in _UNRESTORABLE_STATES:
+            return
+        try:
+            self._attr_native_value = round(float(last_state.state), 8)
+        except ValueError:
+            self._attr_native_value = 0.0
 
     def reset(self):
         self._attr_native_value = 0.0
         self.async_write_ha_state()
 
     def set_value(self, value: float):
-        self._attr_native_value = round(value, 8)
+        value = round(value, 8)
+        written = (value, self._attr_available)
+        # Still write when only the availability changed since the last write
+        if value == self._attr_native_value and written == self._written:
+            return
+        self._attr_native_value = value
+        self._written = written
         self.async_write_ha_state()
 
     def _friendly_name(self) -> str:
@@ -10,6 +10,13 @@ from homeassistant.core import State
 
 _LOGGER = logging.getLogger(__name__)
 
+# Price forecasts drop entries that already started; intervals are at least
+# a quarter of an hour, so extraction results only change per slot.
+_FORECAST_SLOT_SECONDS = 900
+
+# Attributes holding plain per-day price lists, in forecast order
+_DAY_PRICE_KEYS = ("today", "tomorrow")
+
 
 def _coerce_time_base(value: Any) -> int | None:
     """Return a positive integer time-base in minutes if possible."""
@@ -101,14 +108,16 @@ def extract_price_forecast_with_interval(state: State) -> tuple[list[float], int
 
         added = False
         for entry in entries:
+            # Entries are chronological, so timestamps only need parsing
+            # until the first one that has not started yet
             if skip_past and isinstance(entry, dict):
                 start = entry.get("start") or entry.get("from")
                 if isinstance(start, str):
                     start_dt = dt_util.parse_datetime(start)
                     if start_dt is not None:
-                        start_dt = dt_util.as_utc(start_dt)
-                        if start_dt < now:
+                        if dt_util.as_utc(start_dt) < now:
                             continue
+                        skip_past = False
 
             price = _normalize_price_value(entry)
             if price is not None:
@@ -154,7 +163,7 @@ def extract_price_forecast_with_interval(state: State) -> tuple[list[float], int
         return forecast, 60  # raw_today/tomorrow is assumed hourly
 
     combined: list[Any] = []
-    for key in ("today", "tomorrow"):
+    for key in _DAY_PRICE_KEYS:
         attr = state.attributes.get(key)
         if isinstance(attr, list):
             combined.extend(attr)
@@ -175,6 +184,35 @@ def extract_price_forecast_with_interval(state: State) -> tuple[list[float], int
     return [price], 60
 
 
+def price_forecast_slot() -> int:
+    """Return the quarter-hour slot used to key cached price forecasts."""
+    from homeassistant.util import dt as dt_util
+
+    return int(dt_util.utcnow().timestamp()) // _FORECAST_SLOT_SECONDS
+
+
+def price_forecast_key(state: State) -> tuple[Any, str, int]:
+    """Return a cache key for the forecast extracted from ``state``.
+
+    The extraction reads the attributes, falls back to the state value and
+    skips past entries. Home Assistant keeps the same attributes object
+    while they are unchanged, so compare the first item by identity.
+    """
+    return state.attributes, state.state, price_forecast_slot()
+
+
+def same_price_forecast_key(
+    key: tuple[Any, str, int] | None, other: tuple[Any, str, int]
+) -> bool:
+    """Return True when two forecast cache keys describe the same input."""
+    return (
+        key is not None
+        and key[0] is other[0]
+        and key[1] == other[1]
+        and key[2] == other[2]
+    )
+
+
 def extract_price_forecast(state: State) -> list[float]:
     """Extract an hourly price forecast from a Home Assistant price state."""
     prices, _ = extract_price_forecast_with_interval(state)
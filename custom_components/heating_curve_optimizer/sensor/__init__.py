@@ -14,13 +14,11 @@ from ..const import (
     CONF_PRICE_SETTINGS,
     CONF_POWER_CONSUMPTION,
     CONF_SUPPLY_TEMPERATURE_SENSOR,
-    CONF_TIME_BASE,
     SOURCE_TYPE_CONSUMPTION,
     DEFAULT_K_FACTOR,
     DEFAULT_COP_AT_35,
     DEFAULT_OUTDOOR_TEMP_COEFFICIENT,
     DEFAULT_COP_COMPENSATION_FACTOR,
-    DEFAULT_TIME_BASE,
     CONF_K_FACTOR,
     CONF_BASE_COP,
     CONF_OUTDOOR_TEMP_COEFFICIENT,
@@ -63,6 +61,9 @@ from ..calibration_sensor import CalibrationSensor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Polled sensors only read local state or query the recorder in the executor
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -78,6 +79,20 @@ async def async_setup_entry(
     device = entry_data["device"]
     config = entry_data["config"]
 
+    # Read the settings used by several sensors once
+    supply_sensor = config.get(CONF_SUPPLY_TEMPERATURE_SENSOR)
+    power_sensor = config.get(CONF_POWER_CONSUMPTION)
+    cop_params = {
+        "k_factor": float(config.get(CONF_K_FACTOR, DEFAULT_K_FACTOR)),
+        "base_cop": float(config.get(CONF_BASE_COP, DEFAULT_COP_AT_35)),
+        "outdoor_temp_coefficient": float(
+            config.get(CONF_OUTDOOR_TEMP_COEFFICIENT, DEFAULT_OUTDOOR_TEMP_COEFFICIENT)
+        ),
+        "cop_compensation_factor": float(
+            config.get(CONF_COP_COMPENSATION_FACTOR, DEFAULT_COP_COMPENSATION_FACTOR)
+        ),
+    }
+
     # Sensor list
     entities = []
 
@@ -186,24 +201,11 @@ async def async_setup_entry(
             calculated_supply_sensor="sensor.heating_curve_optimizer_calculated_supply_temperature",
             consumption_price_sensor=config.get(CONF_CONSUMPTION_PRICE_SENSOR, ""),
             heat_demand_sensor="sensor.heating_curve_optimizer_net_heat_loss",
-            k_factor=float(config.get(CONF_K_FACTOR, DEFAULT_K_FACTOR)),
-            base_cop=float(config.get(CONF_BASE_COP, DEFAULT_COP_AT_35)),
-            outdoor_temp_coefficient=float(
-                config.get(
-                    CONF_OUTDOOR_TEMP_COEFFICIENT, DEFAULT_OUTDOOR_TEMP_COEFFICIENT
-                )
-            ),
-            cop_compensation_factor=float(
-                config.get(
-                    CONF_COP_COMPENSATION_FACTOR, DEFAULT_COP_COMPENSATION_FACTOR
-                )
-            ),
-            time_base=int(config.get(CONF_TIME_BASE, DEFAULT_TIME_BASE)),
+            **cop_params,
         )
     )
 
     # COP sensors (if supply sensor is configured)
-    supply_sensor = config.get(CONF_SUPPLY_TEMPERATURE_SENSOR)
     calculated_supply_sensor = None
     if supply_sensor:
         entities.append(
@@ -214,14 +216,7 @@ async def async_setup_entry(
                 unique_id=f"{entry.entry_id}_quadratic_cop",
                 supply_sensor=supply_sensor,
                 device=device,
-                k_factor=config.get(CONF_K_FACTOR, DEFAULT_K_FACTOR),
-                base_cop=config.get(CONF_BASE_COP, DEFAULT_COP_AT_35),
-                outdoor_temp_coefficient=config.get(
-                    CONF_OUTDOOR_TEMP_COEFFICIENT, DEFAULT_OUTDOOR_TEMP_COEFFICIENT
-                ),
-                cop_compensation_factor=config.get(
-                    CONF_COP_COMPENSATION_FACTOR, DEFAULT_COP_COMPENSATION_FACTOR
-                ),
+                **cop_params,
             )
         )
 
@@ -251,7 +246,6 @@ async def async_setup_entry(
 
     # Calibration sensor (parameter validation and recommendations)
     # Requires power_sensor, supply_sensor for validation
-    power_sensor = config.get(CONF_POWER_CONSUMPTION)
     if power_sensor and supply_sensor:
         entities.append(
             CalibrationSensor(
@@ -273,7 +267,13 @@ async def async_setup_entry(
 
     # Event-driven sensors (real-time state tracking)
     _setup_event_driven_sensors(
-        hass, entry, config, device, entities, weather_coordinator
+        entry,
+        config,
+        device,
+        entities,
+        supply_sensor=supply_sensor,
+        power_sensor=power_sensor,
+        cop_params=cop_params,
     )
 
     # Daily utility sensors (cumulative energy tracking)
@@ -284,12 +284,14 @@ async def async_setup_entry(
 
 
 def _setup_event_driven_sensors(
-    hass: HomeAssistant,
     entry: ConfigEntry,
     config: dict,
     device,
     entities: list,
-    weather_coordinator,
+    *,
+    supply_sensor: str | None,
+    power_sensor: str | None,
+    cop_params: dict[str, float],
 ) -> None:
     """Set up event-driven sensors that track state changes in real-time."""
 
@@ -299,7 +301,6 @@ def _setup_event_driven_sensors(
         price_settings = config.get(CONF_PRICE_SETTINGS, {})
         entities.append(
             CurrentElectricityPriceSensor(
-                hass=hass,
                 name="Current Electricity Price",
                 unique_id=f"{entry.entry_id}_current_electricity_price",
                 price_sensor=consumption_price_sensor,
@@ -311,19 +312,7 @@ def _setup_event_driven_sensors(
         )
 
     # COP and thermal power sensors
-    supply_sensor = config.get(CONF_SUPPLY_TEMPERATURE_SENSOR)
-    power_sensor = config.get(CONF_POWER_CONSUMPTION)
-
     if supply_sensor and power_sensor:
-        k_factor = float(config.get(CONF_K_FACTOR, DEFAULT_K_FACTOR))
-        base_cop = float(config.get(CONF_BASE_COP, DEFAULT_COP_AT_35))
-        outdoor_temp_coefficient = float(
-            config.get(CONF_OUTDOOR_TEMP_COEFFICIENT, DEFAULT_OUTDOOR_TEMP_COEFFICIENT)
-        )
-        cop_compensation_factor = float(
-            config.get(CONF_COP_COMPENSATION_FACTOR, DEFAULT_COP_COMPENSATION_FACTOR)
-        )
-
         # Find outdoor temperature sensor reference
         outdoor_sensor_ref = None
         for entity in entities:
@@ -335,15 +324,14 @@ def _setup_event_driven_sensors(
 
         # Thermal power sensor
         thermal_power_sensor = HeatPumpThermalPowerSensor(
-            hass=hass,
             name="Heat Pump Thermal Power",
             unique_id=f"{entry.entry_id}_thermal_power",
             power_sensor=power_sensor,
             supply_sensor=supply_sensor,
             outdoor_sensor=outdoor_sensor_ref,
             device=device,
-            k_factor=k_factor,
-            base_cop=base_cop,
+            k_factor=cop_params["k_factor"],
+            base_cop=cop_params["base_cop"],
         )
         entities.append(thermal_power_sensor)
 
@@ -374,11 +362,19 @@ def _setup_event_driven_sensors(
                 "sensor.heating_curve_optimizer_calculated_supply_temperature"
             )
 
+        # Find net heat loss sensor
+        net_heat_loss_sensor = None
+        for entity in entities:
+            if isinstance(entity, CoordinatorNetHeatLossSensor):
+                net_heat_loss_sensor = entity
+                break
+        if net_heat_loss_sensor is None:
+            net_heat_loss_sensor = f"sensor.{DOMAIN}_net_heat_loss"
+
         # COP delta sensor
         if cop_sensor and calculated_supply_sensor:
             entities.append(
                 CopEfficiencyDeltaSensor(
-                    hass=hass,
                     name="COP Delta",
                     unique_id=f"{entry.entry_id}_cop_delta",
                     cop_sensor=cop_sensor,
@@ -386,17 +382,13 @@ def _setup_event_driven_sensors(
                     outdoor_sensor=outdoor_sensor_ref,
                     calculated_supply_sensor=calculated_supply_sensor,
                     device=device,
-                    k_factor=k_factor,
-                    base_cop=base_cop,
-                    outdoor_temp_coefficient=outdoor_temp_coefficient,
-                    cop_compensation_factor=cop_compensation_factor,
+                    **cop_params,
                 )
             )
 
             # Heat generation delta sensor
             entities.append(
                 HeatGenerationDeltaSensor(
-                    hass=hass,
                     name="Heat Generation Delta",
                     unique_id=f"{entry.entry_id}_heat_generation_delta",
                     thermal_power_sensor=thermal_power_sensor,
@@ -405,10 +397,8 @@ def _setup_event_driven_sensors(
                     outdoor_sensor=outdoor_sensor_ref,
                     calculated_supply_sensor=calculated_supply_sensor,
                     device=device,
-                    k_factor=k_factor,
-                    base_cop=base_cop,
-                    outdoor_temp_coefficient=outdoor_temp_coefficient,
-                    cop_compensation_factor=cop_compensation_factor,
+                    net_heat_loss_sensor=net_heat_loss_sensor,
+                    **cop_params,
                 )
             )
 
@@ -6,7 +6,8 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_CELSIUS
+from ...entity import BaseUtilitySensor, translation_key_from_name
 
 
 class CoordinatorCalculatedSupplyTemperatureSensor(
@@ -31,12 +32,12 @@ class CoordinatorCalculatedSupplyTemperatureSensor(
             self,
             name=name,
             unique_id=unique_id,
-            unit="°C",
+            unit=UNIT_CELSIUS,
             device_class="temperature",
             icon="mdi:thermometer",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
@@ -6,12 +6,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 
-from ...entity import BaseUtilitySensor
+from ...entity import BaseUtilitySensor, translation_key_from_name
 from ...const import (
     DEFAULT_K_FACTOR,
     DEFAULT_COP_AT_35,
     DEFAULT_OUTDOOR_TEMP_COEFFICIENT,
     DEFAULT_COP_COMPENSATION_FACTOR,
+    UNAVAILABLE_STATES,
 )
 
 
@@ -40,7 +41,7 @@ class CoordinatorQuadraticCopSensor(BaseUtilitySensor):
             icon="mdi:alpha-c-circle",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self.hass = hass
         self.weather_coordinator = weather_coordinator
@@ -55,7 +56,7 @@ class CoordinatorQuadraticCopSensor(BaseUtilitySensor):
         """Update COP based on supply and outdoor temperature."""
         # Get supply temperature
         s_state = self.hass.states.get(self.supply_sensor)
-        if not s_state or s_state.state in ("unknown", "unavailable"):
+        if not s_state or s_state.state in UNAVAILABLE_STATES:
             self._set_unavailable(f"Supply sensor {self.supply_sensor} unavailable")
             return
 
@@ -19,7 +19,8 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.util import dt as dt_util
 
-from ...entity import BaseUtilitySensor
+from ...const import UNAVAILABLE_STATES, UNIT_KWH
+from ...entity import BaseUtilitySensor, translation_key_from_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,12 +43,12 @@ class HeatPumpEnergyDailySensor(RestoreSensor, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="kWh",
+            unit=UNIT_KWH,
             device_class=SensorDeviceClass.ENERGY,
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self.hass = hass
         self._attr_state_class = SensorStateClass.TOTAL
@@ -155,7 +156,7 @@ class HeatPumpEnergyDailySensor(RestoreSensor, BaseUtilitySensor):
         thermal_state = self.hass.states.get(self.thermal_power_sensor)
 
         # Check if sensor is available
-        if not thermal_state or thermal_state.state in ("unknown", "unavailable"):
+        if not thermal_state or thermal_state.state in UNAVAILABLE_STATES:
             _LOGGER.debug("Thermal power sensor not available")
             return
 
@@ -19,7 +19,8 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.util import dt as dt_util
 
-from ...entity import BaseUtilitySensor
+from ...const import UNAVAILABLE_STATES, UNIT_KWH
+from ...entity import BaseUtilitySensor, translation_key_from_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,12 +43,12 @@ class NetHeatLossEnergyDailySensor(RestoreSensor, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="kWh",
+            unit=UNIT_KWH,
             device_class=SensorDeviceClass.ENERGY,
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self.hass = hass
         self._attr_state_class = SensorStateClass.TOTAL
@@ -151,7 +152,7 @@ class NetHeatLossEnergyDailySensor(RestoreSensor, BaseUtilitySensor):
         heat_loss_state = self.hass.states.get(self.net_heat_loss_sensor)
 
         # Check if sensor is available
-        if not heat_loss_state or heat_loss_state.state in ("unknown", "unavailable"):
+        if not heat_loss_state or heat_loss_state.state in UNAVAILABLE_STATES:
             _LOGGER.debug("Net heat loss sensor not available")
             return
 
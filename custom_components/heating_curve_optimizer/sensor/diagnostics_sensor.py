@@ -7,7 +7,7 @@ from typing import Any
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..entity import BaseUtilitySensor
+from ..entity import BaseUtilitySensor, translation_key_from_name
 
 
 class CoordinatorDiagnosticsSensor(CoordinatorEntity, BaseUtilitySensor):
@@ -34,7 +34,7 @@ class CoordinatorDiagnosticsSensor(CoordinatorEntity, BaseUtilitySensor):
             icon="mdi:information-outline",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_should_poll = False
         # Diagnostics sensor returns string, so no state_class or unit
@@ -95,7 +95,7 @@ class CoordinatorDiagnosticsSensor(CoordinatorEntity, BaseUtilitySensor):
         # Weather coordinator data
         if self.weather_coordinator.data:
             attrs["weather_last_update"] = str(
-                self.weather_coordinator.data.get("timestamp")
+                self.weather_coordinator.last_update_success_time
             )
             attrs["outdoor_temperature"] = self.weather_coordinator.data.get(
                 "current_temperature"
@@ -105,7 +105,9 @@ class CoordinatorDiagnosticsSensor(CoordinatorEntity, BaseUtilitySensor):
 
         # Heat coordinator data
         if self.heat_coordinator.data:
-            attrs["heat_last_update"] = str(self.heat_coordinator.data.get("timestamp"))
+            attrs["heat_last_update"] = str(
+                self.heat_coordinator.last_update_success_time
+            )
             attrs["heat_loss"] = self.heat_coordinator.data.get("heat_loss")
             attrs["solar_gain"] = self.heat_coordinator.data.get("solar_gain")
             attrs["net_heat_loss"] = self.heat_coordinator.data.get("net_heat_loss")
@@ -115,7 +117,7 @@ class CoordinatorDiagnosticsSensor(CoordinatorEntity, BaseUtilitySensor):
         # Optimization coordinator data
         if self.optimization_coordinator.data:
             attrs["optimization_last_update"] = str(
-                self.optimization_coordinator.data.get("timestamp")
+                self.optimization_coordinator.last_update_success_time
             )
             attrs["optimized_offset"] = self.optimization_coordinator.data.get(
                 "optimized_offset"
@@ -7,29 +7,101 @@ as opposed to coordinator-based sensors that update on a schedule.
 from __future__ import annotations
 
 import logging
+import sys
+from math import fabs
 from typing import Any, cast
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import State, callback
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_state_change_event
 
 from ..entity import BaseUtilitySensor
-from ..helpers import extract_price_forecast
+from ..helpers import (
+    extract_price_forecast,
+    price_forecast_key,
+    same_price_forecast_key,
+)
 from ..const import (
     DEFAULT_K_FACTOR,
     DEFAULT_COP_AT_35,
     DEFAULT_OUTDOOR_TEMP_COEFFICIENT,
     DEFAULT_THERMAL_STORAGE_EFFICIENCY,
+    UNAVAILABLE_STATES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coalesce bursts of source updates (e.g. a coordinator push touching offset,
+# outdoor and supply sensors in the same tick) into a single recompute.
+UPDATE_COOLDOWN = 0.25
+
+# Default entity_id of the net heat loss sensor, used when no entity
+# reference is passed in
+_NET_HEAT_LOSS_ENTITY_ID = "sensor.heating_curve_optimizer_net_heat_loss"
+
+
+def _cop(
+    base_cop: float,
+    outdoor_coefficient: float,
+    k_factor: float,
+    outdoor_temp: float,
+    supply_temp: float,
+    compensation: float = 1.0,
+) -> float:
+    """Return the linear COP estimate shared by the event-driven sensors."""
+
+    return (
+        base_cop + outdoor_coefficient * outdoor_temp - k_factor * (supply_temp - 35)
+    ) * compensation
+
+
+# The efficiency is a constant, so it is baked into the template once.
+_EXPLANATION = (
+    "Buffer changing at {0:.3f} kW (offset {1}°C × demand {2:.3f} kW "
+    f"× efficiency {DEFAULT_THERMAL_STORAGE_EFFICIENCY})"
+)
+
+
+def _try_float(value: Any) -> float | None:
+    """Return ``value`` as float, or None when it is not numeric."""
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _state_float(
+    cache: dict[str, tuple[State, float | None]], state: State
+) -> float | None:
+    """Return the state as float, reusing the last parse of the same state.
+
+    Home Assistant replaces the State object whenever an entity changes, so
+    an identical object means the string is unchanged. Returns None for
+    non-numeric states.
+    """
+
+    cached = cache.get(state.entity_id)
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    value = _try_float(state.state)
+    cache[state.entity_id] = (state, value)
+    return value
+
+
+def _resolve_entity_id(entity_ref: str | SensorEntity | None) -> str | None:
+    """Return the entity_id for a reference or None if unavailable."""
+
+    if isinstance(entity_ref, SensorEntity):
+        return entity_ref.entity_id
+    return entity_ref
+
 
 class CurrentElectricityPriceSensor(BaseUtilitySensor):
     def __init__(
         self,
-        hass: HomeAssistant,
         name: str,
         unique_id: str,
         price_sensor: str,
@@ -47,44 +119,54 @@ class CurrentElectricityPriceSensor(BaseUtilitySensor):
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key="current_electricity_price",
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.hass = hass
+        self._attr_should_poll = False
         self.price_sensor = price_sensor
         self.source_type = source_type
         self.price_settings = price_settings
         self._extra_attrs: dict[str, Any] = {}
+        self._attrs_key: tuple[Any, str, int] | None = None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         return self._extra_attrs
 
-    async def async_update(self):
-        state = self.hass.states.get(self.price_sensor)
-        if state is None or state.state in ("unknown", "unavailable"):
+    def _apply_state(self, state: State | None) -> None:
+        """Update value and attributes from a price sensor state."""
+
+        if state is None or state.state in UNAVAILABLE_STATES:
             self._attr_available = False
             self._extra_attrs = {}
+            self._attrs_key = None
             _LOGGER.warning("Price sensor %s is unavailable", self.price_sensor)
             return
-        try:
-            base_price = float(state.state)
-        except ValueError:
+        base_price = _try_float(state.state)
+        if base_price is None:
             self._attr_available = False
             self._extra_attrs = {}
+            self._attrs_key = None
             _LOGGER.warning("Price sensor %s has invalid state", self.price_sensor)
             return
         self._attr_available = True
 
         self._attr_native_value = round(base_price, 8)
+        # The forecast only needs parsing again when the price sensor
+        # publishes new attributes or value, or a forecast slot has passed.
+        key = price_forecast_key(state)
+        if same_price_forecast_key(self._attrs_key, key):
+            return
         attrs: dict[str, Any] = dict(state.attributes)
         forecast = extract_price_forecast(state)
         if forecast:
             attrs["forecast_prices"] = forecast
         self._extra_attrs = attrs
+        self._attrs_key = key
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
+        self._apply_state(self.hass.states.get(self.price_sensor))
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
@@ -93,16 +175,16 @@ class CurrentElectricityPriceSensor(BaseUtilitySensor):
             )
         )
 
-    async def async_will_remove_from_hass(self):
-        await super().async_will_remove_from_hass()
-
-    async def _handle_price_change(self, event):
+    @callback
+    def _handle_price_change(self, event):
         new_state = event.data.get("new_state")
-        if new_state is None or new_state.state in ("unknown", "unavailable"):
-            self._attr_available = False
-            _LOGGER.warning("Price sensor %s is unavailable", self.price_sensor)
+        previous = (self._attr_native_value, self._attr_available, self._attrs_key)
+        # The event already carries the new state; no need to look it up again.
+        # Unavailable sources are applied too so the change gets published.
+        self._apply_state(new_state)
+        # The attributes key only changes when new attributes were published
+        if (self._attr_native_value, self._attr_available, self._attrs_key) == previous:
             return
-        await self.async_update()
         # During unit tests the entity is not added via an EntityComponent and
         # therefore does not get an entity_id assigned. In that case
         # ``async_write_ha_state`` would raise ``NoEntitySpecifiedError``. We
@@ -117,7 +199,6 @@ class HeatPumpThermalPowerSensor(BaseUtilitySensor):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         name: str,
         unique_id: str,
         power_sensor: str,
@@ -135,105 +216,152 @@ class HeatPumpThermalPowerSensor(BaseUtilitySensor):
             icon="mdi:fire",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key="heat_pump_thermal_power",
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.hass = hass
-        self.power_sensor = power_sensor
-        self.supply_sensor = supply_sensor
+        self._attr_should_poll = False
+        self.power_sensor = sys.intern(power_sensor)
+        self.supply_sensor = sys.intern(supply_sensor)
         self.outdoor_sensor = outdoor_sensor
         self.k_factor = k_factor
         self.base_cop = base_cop
+        # Parsed source values maintained by state-change events once the
+        # entity is added: entity_id -> (value, unavailable reason)
+        self._source_kinds: dict[str, str] = {}
+        self._source_cache: dict[str, tuple[float | None, str | None]] = {}
+        self._tracking = False
+        # Inputs of the last computation; unchanged inputs reuse its output
+        self._last_input_key: tuple[float, ...] | None = None
+        self._last_output = 0.0
+
+    @staticmethod
+    def _parse_source(
+        kind: str, entity_id: str, state: State | None
+    ) -> tuple[float | None, str | None]:
+        """Parse a source state into a value or an unavailability reason."""
 
-    async def async_update(self):
-        p_state = self.hass.states.get(self.power_sensor)
-        if p_state is None:
-            self._set_unavailable(
-                f"vermogenssensor {self.power_sensor} werd niet gevonden"
-            )
-            return
-        if p_state.state in ("unknown", "unavailable"):
-            self._set_unavailable(
-                f"vermogenssensor {self.power_sensor} heeft status '{p_state.state}'"
-            )
-            return
+        if state is None:
+            if kind == "buitensensor":
+                return None, f"geen buitensensor gevonden ({entity_id})"
+            return None, f"{kind} {entity_id} werd niet gevonden"
+        if state.state in UNAVAILABLE_STATES:
+            return None, f"{kind} {entity_id} heeft status '{state.state}'"
+        value = _try_float(state.state)
+        if value is None:
+            return None, f"waarde van {kind} {entity_id} is ongeldig"
+        return value, None
+
+    def _resolve_outdoor_sensor(self) -> str | None:
+        """Return the outdoor entity id, resolving an entity reference once."""
 
-        s_state = self.hass.states.get(self.supply_sensor)
-        if s_state is None:
-            self._set_unavailable(
-                f"aanvoersensor {self.supply_sensor} werd niet gevonden"
+        if isinstance(self.outdoor_sensor, SensorEntity):
+            if not self.outdoor_sensor.entity_id:
+                return None
+            self.outdoor_sensor = sys.intern(self.outdoor_sensor.entity_id)
+            if self._tracking:
+                # Resolved after this entity was added; track it from now on
+                self._track_sources({self.outdoor_sensor: "buitensensor"})
+        return self.outdoor_sensor
+
+    def _track_sources(self, kinds: dict[str, str]) -> None:
+        """Parse the given sources and keep them current via state events."""
+
+        for entity_id, kind in kinds.items():
+            self._source_kinds[entity_id] = kind
+            self._source_cache[entity_id] = self._parse_source(
+                kind, entity_id, self.hass.states.get(entity_id)
             )
-            return
-        if s_state.state in ("unknown", "unavailable"):
-            self._set_unavailable(
-                f"aanvoersensor {self.supply_sensor} heeft status '{s_state.state}'"
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, list(kinds), self._handle_source_change
             )
-            return
-
-        entity_id = (
-            self.outdoor_sensor.entity_id
-            if isinstance(self.outdoor_sensor, SensorEntity)
-            else cast(str, self.outdoor_sensor)
         )
-        sensor_name = entity_id or str(self.outdoor_sensor)
 
-        if entity_id is None:
+    def _compute_value(self) -> None:
+        """Recompute the thermal power from the parsed source values."""
+
+        outdoor_sensor = self._resolve_outdoor_sensor()
+        if outdoor_sensor is None:
             self._set_unavailable("geen buitensensor gevonden")
             return
 
-        o_state = self.hass.states.get(entity_id)
-        if (
-            isinstance(self.outdoor_sensor, SensorEntity)
-            and self.outdoor_sensor.entity_id
+        values: list[float] = []
+        for kind, entity_id in (
+            ("vermogenssensor", self.power_sensor),
+            ("aanvoersensor", self.supply_sensor),
+            ("buitensensor", outdoor_sensor),
         ):
-            self.outdoor_sensor = self.outdoor_sensor.entity_id
-            entity_id = cast(str, self.outdoor_sensor)
-            sensor_name = entity_id
+            cached = self._source_cache.get(entity_id)
+            if cached is None:
+                cached = self._parse_source(
+                    kind, entity_id, self.hass.states.get(entity_id)
+                )
+            value, reason = cached
+            if value is None:
+                self._set_unavailable(cast(str, reason))
+                return
+            values.append(value)
 
-        if o_state is None:
-            self._set_unavailable(f"geen buitensensor gevonden ({sensor_name})")
-            return
-        if o_state.state in ("unknown", "unavailable"):
-            self._set_unavailable(
-                f"buitensensor {sensor_name} heeft status '{o_state.state}'"
-            )
+        self._mark_available()
+        key = tuple(values)
+        if key == self._last_input_key:
+            self._attr_native_value = self._last_output
             return
 
-        try:
-            power = float(p_state.state)
-        except ValueError:
-            self._set_unavailable(
-                f"waarde van vermogenssensor {self.power_sensor} is ongeldig"
-            )
-            return
-        try:
-            s_temp = float(s_state.state)
-        except ValueError:
-            self._set_unavailable(
-                f"waarde van aanvoersensor {self.supply_sensor} is ongeldig"
-            )
-            return
-        try:
-            o_temp = float(o_state.state)
-        except ValueError:
-            self._set_unavailable(f"waarde van buitensensor {sensor_name} is ongeldig")
-            return
-        cop = self.base_cop + 0.08 * o_temp - self.k_factor * (s_temp - 35)
+        power, s_temp, o_temp = values
+        cop = _cop(self.base_cop, 0.08, self.k_factor, o_temp, s_temp)
         thermal_power = power * cop / 1000.0
-        _LOGGER.debug(
-            "Thermal power calc power=%s cop=%s -> %s",
-            power,
-            cop,
-            thermal_power,
-        )
-        self._mark_available()
-        self._attr_native_value = round(thermal_power, 3)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Thermal power calc power=%s cop=%s -> %s",
+                power,
+                cop,
+                thermal_power,
+            )
+        self._last_input_key = key
+        self._last_output = round(thermal_power, 3)
+        self._attr_native_value = self._last_output
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        if isinstance(self.outdoor_sensor, SensorEntity):
-            self.outdoor_sensor = self.outdoor_sensor.entity_id
-
+        kinds = {
+            self.power_sensor: "vermogenssensor",
+            self.supply_sensor: "aanvoersensor",
+        }
+        outdoor_sensor = self._resolve_outdoor_sensor()
+        if outdoor_sensor is not None:
+            kinds[outdoor_sensor] = "buitensensor"
+        self._track_sources(kinds)
+        # An outdoor reference without entity_id yet is subscribed to once
+        # it resolves on a later recompute
+        self._tracking = True
+        self._compute_value()
+
+    @callback
+    def _handle_source_change(self, event) -> None:
+        """Re-parse only the source that changed and recompute."""
+
+        entity_id = event.data["entity_id"]
+        kind = self._source_kinds.get(entity_id)
+        if kind is None:
+            return
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        # Only the state value is parsed, so attribute-only updates are ignored
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            return
+        self._source_cache[entity_id] = self._parse_source(kind, entity_id, new_state)
+        previous = (self._attr_native_value, self._attr_available)
+        self._compute_value()
+        # Rounded output often stays the same for small input changes
+        if (self._attr_native_value, self._attr_available) == previous:
+            return
+        if self.entity_id:
+            self.async_write_ha_state()
 
 # New sensor classes start here
 
@@ -243,7 +371,6 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         name: str,
         unique_id: str,
         *,
@@ -265,10 +392,10 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
             icon="mdi:alpha-c-circle",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key="cop_delta",
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.hass = hass
+        self._attr_should_poll = False
         self.cop_sensor = cop_sensor
         self.offset_entity = offset_entity
         self.outdoor_sensor = outdoor_sensor
@@ -277,7 +404,15 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
         self.base_cop = base_cop
         self.outdoor_temp_coefficient = outdoor_temp_coefficient
         self.cop_compensation_factor = cop_compensation_factor
+        # Updated in place; Home Assistant copies it when writing the state
         self._extra_attrs: dict[str, list[float] | float] = {}
+        self._baseline_key: tuple[float, float] | None = None
+        self._baseline_cop = 0.0
+        self._zero_cop_key: tuple[int, float] | None = None
+        self._zero_cop: list[float] = []
+        # All-zero delta lists only depend on the forecast horizon
+        self._zero_deltas_cache: dict[int, list[float]] = {}
+        self._float_cache: dict[str, tuple[State, float | None]] = {}
 
     @property
     def extra_state_attributes(self) -> dict[str, list[float] | float]:
@@ -285,51 +420,55 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
-        for ent in (
-            self._resolve_entity_id(self.cop_sensor),
-            self._resolve_entity_id(self.offset_entity),
-            self._resolve_entity_id(self.outdoor_sensor),
-            self._resolve_entity_id(self.calculated_supply_sensor),
-        ):
-            if ent is None:
-                continue
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh,
+        )
+        self.async_on_remove(self._debouncer.async_cancel)
+        # Referenced entities are added before this one, so their entity_ids
+        # are known here; resolve them once instead of on every state lookup.
+        self.cop_sensor = _resolve_entity_id(self.cop_sensor)
+        self.offset_entity = _resolve_entity_id(self.offset_entity)
+        self.outdoor_sensor = _resolve_entity_id(self.outdoor_sensor)
+        self.calculated_supply_sensor = _resolve_entity_id(
+            self.calculated_supply_sensor
+        )
+        # Not polled, so compute the initial value here
+        self._compute_value()
+        tracked = [
+            ent
+            for ent in (
+                self.cop_sensor,
+                self.offset_entity,
+                self.outdoor_sensor,
+                self.calculated_supply_sensor,
+            )
+            if ent is not None
+        ]
+        if tracked:
             self.async_on_remove(
-                async_track_state_change_event(self.hass, ent, self._handle_change)
+                async_track_state_change_event(self.hass, tracked, self._handle_change)
             )
 
-    async def _handle_change(self, event):  # pragma: no cover - simple callback
-        await self.async_update()
+    @callback
+    def _handle_change(self, event):
+        self._debouncer.async_schedule_call()
+
+    async def _async_refresh(self) -> None:
+        self._compute_value()
         self.async_write_ha_state()
 
-    def _resolve_entity_id(self, entity_ref: str | SensorEntity) -> str | None:
-        """Return the entity_id for a reference or None if unavailable."""
-
-        if isinstance(entity_ref, SensorEntity):
-            entity_id = entity_ref.entity_id
-            if entity_id is not None:
-                if entity_ref is self.cop_sensor:
-                    self.cop_sensor = entity_id
-                elif entity_ref is self.offset_entity:
-                    self.offset_entity = entity_id
-                elif entity_ref is self.outdoor_sensor:
-                    self.outdoor_sensor = entity_id
-                elif entity_ref is self.calculated_supply_sensor:
-                    self.calculated_supply_sensor = entity_id
-            return entity_id
-        return cast(str, entity_ref)
-
-    def _get_state(self, entity_ref: str | SensorEntity) -> State | None:
-        """Return hass state for the given entity reference."""
-
-        entity_id = self._resolve_entity_id(entity_ref)
+    def _get_state(self, entity_id: str | None) -> State | None:
+        """Return hass state for a resolved entity_id."""
+
         if entity_id is None:
             return None
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            return None
-        return state
+        return self.hass.states.get(entity_id)
 
-    async def async_update(self):
+    def _compute_value(self) -> None:
         offset_state = self._get_state(self.offset_entity)
         outdoor_state = self._get_state(self.outdoor_sensor)
         calculated_supply_state = self._get_state(self.calculated_supply_sensor)
@@ -338,16 +477,16 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
             offset_state is None
             or outdoor_state is None
             or calculated_supply_state is None
-            or outdoor_state.state in ("unknown", "unavailable")
-            or calculated_supply_state.state in ("unknown", "unavailable")
+            or outdoor_state.state in UNAVAILABLE_STATES
+            or calculated_supply_state.state in UNAVAILABLE_STATES
         ):
             self._attr_available = False
             return
 
-        try:
-            outdoor_temp = float(outdoor_state.state)
-            baseline_supply_temp = float(calculated_supply_state.state)
-        except ValueError:
+        floats = self._float_cache
+        outdoor_temp = _state_float(floats, outdoor_state)
+        baseline_supply_temp = _state_float(floats, calculated_supply_state)
+        if outdoor_temp is None or baseline_supply_temp is None:
             self._attr_available = False
             return
 
@@ -357,49 +496,70 @@ class CopEfficiencyDeltaSensor(BaseUtilitySensor):
             return
 
         # Check current offset - if 0, delta should be 0
-        try:
-            current_offset = float(offset_state.state)
-        except (ValueError, TypeError):
+        current_offset = _state_float(floats, offset_state)
+        if current_offset is None:
             current_offset = 0.0
 
-        # Calculate baseline COP (without offset)
-        baseline_cop = (
-            self.base_cop
-            + self.outdoor_temp_coefficient * outdoor_temp
-            - self.k_factor * (baseline_supply_temp - 35)
-        ) * self.cop_compensation_factor
-        baseline_cop = max(0.5, baseline_cop)
+        # Calculate baseline COP (without offset); both inputs change slowly,
+        # so reuse the previous value while they are unchanged
+        baseline_key = (outdoor_temp, baseline_supply_temp)
+        if baseline_key == self._baseline_key:
+            baseline_cop = self._baseline_cop
+        else:
+            baseline_cop = max(
+                0.5,
+                _cop(
+                    self.base_cop,
+                    self.outdoor_temp_coefficient,
+                    self.k_factor,
+                    outdoor_temp,
+                    baseline_supply_temp,
+                    self.cop_compensation_factor,
+                ),
+            )
+            self._baseline_key = baseline_key
+            self._baseline_cop = baseline_cop
 
         # If offset is 0, no optimization is active, so delta is 0
-        if abs(current_offset) < 0.01:
+        if fabs(current_offset) < 0.01:
+            horizon = len(supply_temps)
+            baseline_rounded = round(baseline_cop, 3)
+            zero_key = (horizon, baseline_rounded)
+            if zero_key != self._zero_cop_key:
+                self._zero_cop = [baseline_rounded] * horizon
+                self._zero_cop_key = zero_key
+            zero_deltas = self._zero_deltas_cache.get(horizon)
+            if zero_deltas is None:
+                zero_deltas = self._zero_deltas_cache[horizon] = [0.0] * horizon
             self._attr_native_value = 0.0
-            self._extra_attrs = {
-                "future_cop": [round(baseline_cop, 3)] * len(supply_temps),
-                "cop_deltas": [0.0] * len(supply_temps),
-                "baseline_cop": round(baseline_cop, 3),
-            }
+            attrs = self._extra_attrs
+            attrs["future_cop"] = self._zero_cop
+            attrs["cop_deltas"] = zero_deltas
+            attrs["baseline_cop"] = baseline_rounded
             self._attr_available = True
             return
 
-        # Calculate predicted COPs with optimized supply temperatures
-        predicted_cops = [
-            max(
-                0.5,
-                (
-                    self.base_cop
-                    + self.outdoor_temp_coefficient * outdoor_temp
-                    - self.k_factor * (float(s_temp) - 35)
-                )
-                * self.cop_compensation_factor,
-            )
-            for s_temp in supply_temps
-        ]
-        cop_deltas = [round(c - baseline_cop, 3) for c in predicted_cops]
-        self._extra_attrs = {
-            "future_cop": [round(c, 3) for c in predicted_cops],
-            "cop_deltas": cop_deltas,
-            "baseline_cop": round(baseline_cop, 3),
-        }
+        # Calculate predicted COPs with optimized supply temperatures in a
+        # single pass; the COP is linear in the supply temperature, so only
+        # intercept - slope * s_temp varies per step.
+        intercept = (
+            self.base_cop
+            + self.outdoor_temp_coefficient * outdoor_temp
+            + self.k_factor * 35
+        ) * self.cop_compensation_factor
+        slope = self.k_factor * self.cop_compensation_factor
+        future_cop: list[float] = []
+        cop_deltas: list[float] = []
+        for s_temp in supply_temps:
+            cop = intercept - slope * float(s_temp)
+            if cop < 0.5:
+                cop = 0.5
+            future_cop.append(round(cop, 3))
+            cop_deltas.append(round(cop - baseline_cop, 3))
+        attrs = self._extra_attrs
+        attrs["future_cop"] = future_cop
+        attrs["cop_deltas"] = cop_deltas
+        attrs["baseline_cop"] = round(baseline_cop, 3)
         self._attr_native_value = cop_deltas[0] if cop_deltas else 0.0
         self._attr_available = True
 
@@ -420,7 +580,6 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         name: str,
         unique_id: str,
         *,
@@ -430,6 +589,7 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
         outdoor_sensor: str | SensorEntity,
         calculated_supply_sensor: str | SensorEntity,
         device: DeviceInfo,
+        net_heat_loss_sensor: str | SensorEntity = _NET_HEAT_LOSS_ENTITY_ID,
         k_factor: float = DEFAULT_K_FACTOR,
         base_cop: float = DEFAULT_COP_AT_35,
         outdoor_temp_coefficient: float = DEFAULT_OUTDOOR_TEMP_COEFFICIENT,
@@ -443,20 +603,25 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
             icon="mdi:fire",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key="heat_generation_delta",
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.hass = hass
+        self._attr_should_poll = False
         self.thermal_power_sensor = thermal_power_sensor
         self.cop_sensor = cop_sensor
         self.offset_entity = offset_entity
         self.outdoor_sensor = outdoor_sensor
         self.calculated_supply_sensor = calculated_supply_sensor
+        self.net_heat_loss_sensor = net_heat_loss_sensor
         self.k_factor = k_factor
         self.base_cop = base_cop
         self.outdoor_temp_coefficient = outdoor_temp_coefficient
         self.cop_compensation_factor = cop_compensation_factor
+        # Updated in place; Home Assistant copies it when writing the state
         self._extra_attrs: dict[str, list[float] | float] = {}
+        self._rates_cache: tuple[Any, Any, list[float]] | None = None
+        self._explanation_cache: tuple[tuple[float, float, float], str] | None = None
+        self._float_cache: dict[str, tuple[State, float | None]] = {}
 
     @property
     def extra_state_attributes(self) -> dict[str, list[float] | float]:
@@ -464,58 +629,62 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
-        # Track offset sensor for changes
-        offset_entity_id = self._resolve_entity_id(self.offset_entity)
-        if offset_entity_id:
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh,
+        )
+        self.async_on_remove(self._debouncer.async_cancel)
+        # Referenced entities are added before this one, so their entity_ids
+        # are known here; resolve them once instead of on every state lookup.
+        self.thermal_power_sensor = _resolve_entity_id(self.thermal_power_sensor)
+        self.cop_sensor = _resolve_entity_id(self.cop_sensor)
+        self.offset_entity = _resolve_entity_id(self.offset_entity)
+        self.outdoor_sensor = _resolve_entity_id(self.outdoor_sensor)
+        self.calculated_supply_sensor = _resolve_entity_id(
+            self.calculated_supply_sensor
+        )
+        self.net_heat_loss_sensor = _resolve_entity_id(self.net_heat_loss_sensor)
+        # Not polled, so compute the initial value here
+        self._compute_value()
+        # Track offset and net heat loss sensors for changes
+        tracked = [
+            ent for ent in (self.offset_entity, self.net_heat_loss_sensor) if ent
+        ]
+        if tracked:
             self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, offset_entity_id, self._handle_change
-                )
+                async_track_state_change_event(self.hass, tracked, self._handle_change)
             )
-        # Track net heat loss sensor for changes
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                "sensor.heating_curve_optimizer_net_heat_loss",
-                self._handle_change,
-            )
-        )
 
-    async def _handle_change(self, event):  # pragma: no cover - simple callback
-        await self.async_update()
+    @callback
+    def _handle_change(self, event):
+        self._debouncer.async_schedule_call()
+
+    async def _async_refresh(self) -> None:
+        self._compute_value()
         self.async_write_ha_state()
 
-    def _resolve_entity_id(self, entity_ref: str | SensorEntity) -> str | None:
-        """Return the entity_id for a reference or None if unavailable."""
-
-        if isinstance(entity_ref, SensorEntity):
-            entity_id = entity_ref.entity_id
-            if entity_id is not None:
-                if entity_ref is self.thermal_power_sensor:
-                    self.thermal_power_sensor = entity_id
-                elif entity_ref is self.cop_sensor:
-                    self.cop_sensor = entity_id
-                elif entity_ref is self.offset_entity:
-                    self.offset_entity = entity_id
-                elif entity_ref is self.outdoor_sensor:
-                    self.outdoor_sensor = entity_id
-                elif entity_ref is self.calculated_supply_sensor:
-                    self.calculated_supply_sensor = entity_id
-            return entity_id
-        return cast(str, entity_ref)
-
-    def _get_state(self, entity_ref: str | SensorEntity) -> State | None:
-        """Return hass state for the given entity reference."""
-
-        entity_id = self._resolve_entity_id(entity_ref)
+    def _get_state(self, entity_id: str | None) -> State | None:
+        """Return hass state for a resolved entity_id."""
+
         if entity_id is None:
             return None
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            return None
-        return state
+        return self.hass.states.get(entity_id)
+
+    def _explanation(self, rate: float, offset: float, demand: float) -> str:
+        """Return the explanation text, formatting it only when inputs change."""
+
+        key = (rate, offset, demand)
+        cache = self._explanation_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        text = _EXPLANATION.format(rate, offset, demand)
+        self._explanation_cache = (key, text)
+        return text
 
-    async def async_update(self):
+    def _compute_value(self) -> None:
         """Calculate buffer change rate based on offset and heat demand.
 
         Buffer change rate = offset × heat_demand × thermal_storage_efficiency
@@ -530,20 +699,20 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
             return
 
         # Get current offset
-        try:
-            current_offset = float(offset_state.state)
-        except (ValueError, TypeError):
+        floats = self._float_cache
+        current_offset = _state_float(floats, offset_state)
+        if current_offset is None:
             self._attr_available = False
             return
 
         # If offset is 0, no thermal storage is happening
-        if abs(current_offset) < 0.01:
+        if fabs(current_offset) < 0.01:
             self._attr_native_value = 0.0
-            self._extra_attrs = {
-                "buffer_change_rate": 0.0,
-                "future_buffer_change_rates": [],
-                "explanation": "No offset applied - no buffer change",
-            }
+            attrs = self._extra_attrs
+            attrs.clear()
+            attrs["buffer_change_rate"] = 0.0
+            attrs["future_buffer_change_rates"] = []
+            attrs["explanation"] = "No offset applied - no buffer change"
             self._attr_available = True
             return
 
@@ -554,21 +723,19 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
 
         if not demand_forecast or not optimized_offsets:
             # Fallback: try to get net heat loss from the net heat loss sensor
-            net_heat_loss_state = self.hass.states.get(
-                "sensor.heating_curve_optimizer_net_heat_loss"
-            )
-            if net_heat_loss_state is None or net_heat_loss_state.state in (
-                "unknown",
-                "unavailable",
+            net_heat_loss_state = self._get_state(self.net_heat_loss_sensor)
+            if (
+                net_heat_loss_state is None
+                or net_heat_loss_state.state in UNAVAILABLE_STATES
             ):
                 self._attr_available = False
                 return
 
-            try:
-                current_heat_demand = max(0.0, float(net_heat_loss_state.state))
-            except (ValueError, TypeError):
+            heat_demand = _state_float(floats, net_heat_loss_state)
+            if heat_demand is None:
                 self._attr_available = False
                 return
+            current_heat_demand = max(0.0, heat_demand)
 
             # Calculate current buffer change rate
             buffer_change_rate = (
@@ -578,28 +745,41 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
             )
 
             self._attr_native_value = round(buffer_change_rate, 3)
-            self._extra_attrs = {
-                "buffer_change_rate": round(buffer_change_rate, 3),
-                "current_offset": current_offset,
-                "current_heat_demand": round(current_heat_demand, 3),
-                "thermal_storage_efficiency": DEFAULT_THERMAL_STORAGE_EFFICIENCY,
-                "explanation": (
-                    f"Buffer changing at {buffer_change_rate:.3f} kW "
-                    f"(offset {current_offset}°C × demand {current_heat_demand:.3f} kW "
-                    f"× efficiency {DEFAULT_THERMAL_STORAGE_EFFICIENCY})"
-                ),
-            }
+            attrs = self._extra_attrs
+            attrs.clear()
+            attrs["buffer_change_rate"] = self._attr_native_value
+            attrs["current_offset"] = current_offset
+            attrs["current_heat_demand"] = round(current_heat_demand, 3)
+            attrs["thermal_storage_efficiency"] = DEFAULT_THERMAL_STORAGE_EFFICIENCY
+            attrs["explanation"] = self._explanation(
+                buffer_change_rate, current_offset, current_heat_demand
+            )
             self._attr_available = True
             return
 
-        # Calculate future buffer change rates from optimization data
-        future_buffer_change_rates = [
-            round(
-                offset * max(0.0, demand) * DEFAULT_THERMAL_STORAGE_EFFICIENCY,
-                3,
+        # Calculate future buffer change rates from optimization data. Home
+        # Assistant reuses the attribute objects while they are unchanged, so
+        # the result is cached against the identity of both source lists.
+        cache = self._rates_cache
+        if (
+            cache is not None
+            and cache[0] is optimized_offsets
+            and cache[1] is demand_forecast
+        ):
+            future_buffer_change_rates = cache[2]
+        else:
+            efficiency = DEFAULT_THERMAL_STORAGE_EFFICIENCY
+            # Negative demand (net heat gain) is clamped inline; a conditional
+            # expression avoids a builtin max() call per forecast step.
+            future_buffer_change_rates = [
+                round(offset * (demand if demand > 0 else 0.0) * efficiency, 3)
+                for offset, demand in zip(optimized_offsets, demand_forecast)
+            ]
+            self._rates_cache = (
+                optimized_offsets,
+                demand_forecast,
+                future_buffer_change_rates,
             )
-            for offset, demand in zip(optimized_offsets, demand_forecast)
-        ]
 
         # Current buffer change rate
         if demand_forecast:
@@ -614,16 +794,14 @@ class HeatGenerationDeltaSensor(BaseUtilitySensor):
             current_heat_demand = 0.0
 
         self._attr_native_value = round(buffer_change_rate, 3)
-        self._extra_attrs = {
-            "buffer_change_rate": round(buffer_change_rate, 3),
-            "future_buffer_change_rates": future_buffer_change_rates,
-            "current_offset": current_offset,
-            "current_heat_demand": round(current_heat_demand, 3),
-            "thermal_storage_efficiency": DEFAULT_THERMAL_STORAGE_EFFICIENCY,
-            "explanation": (
-                f"Buffer changing at {buffer_change_rate:.3f} kW "
-                f"(offset {current_offset}°C × demand {current_heat_demand:.3f} kW "
-                f"× efficiency {DEFAULT_THERMAL_STORAGE_EFFICIENCY})"
-            ),
-        }
+        attrs = self._extra_attrs
+        attrs.clear()
+        attrs["buffer_change_rate"] = self._attr_native_value
+        attrs["future_buffer_change_rates"] = future_buffer_change_rates
+        attrs["current_offset"] = current_offset
+        attrs["current_heat_demand"] = round(current_heat_demand, 3)
+        attrs["thermal_storage_efficiency"] = DEFAULT_THERMAL_STORAGE_EFFICIENCY
+        attrs["explanation"] = self._explanation(
+            buffer_change_rate, current_offset, current_heat_demand
+        )
         self._attr_available = True
@@ -8,10 +8,27 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import (
+    CONF_AREA_M2,
+    CONF_ENERGY_LABEL,
+    CONF_VENTILATION_TYPE,
+    CONF_CEILING_HEIGHT,
+    DEFAULT_VENTILATION_TYPE,
+    DEFAULT_CEILING_HEIGHT,
+    VENTILATION_TYPES,
+    calculate_htc_from_energy_label,
+    calculate_ventilation_htc,
+)
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    translation_key_from_name,
+)
 
 
-class CoordinatorHeatLossSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorHeatLossSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Heat loss sensor using heat calculation coordinator."""
 
     def __init__(
@@ -28,10 +45,13 @@ class CoordinatorHeatLossSensor(CoordinatorEntity, BaseUtilitySensor):
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
+        # Building attributes only depend on the config entry; forecast
+        # attributes are cached per coordinator data object.
+        self._building_attrs: dict[str, Any] | None = None
 
     @property
     def native_value(self):
@@ -47,24 +67,19 @@ class CoordinatorHeatLossSensor(CoordinatorEntity, BaseUtilitySensor):
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return forecast and diagnostic attributes."""
-        if not self.coordinator.data:
-            return {}
+        if self._building_attrs is None:
+            self._building_attrs = self._compute_building_attrs()
 
-        from ...const import (
-            CONF_AREA_M2,
-            CONF_ENERGY_LABEL,
-            CONF_VENTILATION_TYPE,
-            CONF_CEILING_HEIGHT,
-            DEFAULT_VENTILATION_TYPE,
-            DEFAULT_CEILING_HEIGHT,
-            VENTILATION_TYPES,
-            calculate_htc_from_energy_label,
-            calculate_ventilation_htc,
-        )
+        return {
+            "forecast": data.get("heat_loss_forecast", []),
+            "forecast_time_base": 60,
+            **self._building_attrs,
+        }
 
+    def _compute_building_attrs(self) -> dict[str, Any]:
+        """Return the HTC breakdown derived from the static building config."""
         config = self.coordinator.config
         area_m2 = config.get(CONF_AREA_M2, 0)
         energy_label = config.get(CONF_ENERGY_LABEL, "C")
@@ -88,8 +103,6 @@ class CoordinatorHeatLossSensor(CoordinatorEntity, BaseUtilitySensor):
         ach = vent_data.get("ach", 1.0)
 
         return {
-            "forecast": self.coordinator.data.get("heat_loss_forecast", []),
-            "forecast_time_base": 60,
             "htc_total_w_per_k": round(htc, 1),
             "htc_transmission_w_per_k": round(h_t, 1),
             "htc_ventilation_w_per_k": round(h_v, 1),
@@ -8,10 +8,16 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    translation_key_from_name,
+)
 
 
-class CoordinatorPVProductionForecastSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorPVProductionForecastSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """PV production forecast sensor using heat calculation coordinator."""
 
     def __init__(
@@ -28,7 +34,7 @@ class CoordinatorPVProductionForecastSensor(CoordinatorEntity, BaseUtilitySensor
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
@@ -48,12 +54,9 @@ class CoordinatorPVProductionForecastSensor(CoordinatorEntity, BaseUtilitySensor
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return forecast attributes."""
-        if not self.coordinator.data:
-            return {}
         return {
-            "forecast": self.coordinator.data.get("pv_production_forecast", []),
+            "forecast": data.get("pv_production_forecast", []),
             "forecast_time_base": 60,
         }
@@ -8,10 +8,18 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_EUR
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    EMPTY_FORECAST,
+    translation_key_from_name,
+)
 
 
-class CoordinatorCostSavingsSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorCostSavingsSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Cost savings forecast sensor showing predicted optimization savings in EUR."""
 
     def __init__(
@@ -23,12 +31,12 @@ class CoordinatorCostSavingsSensor(CoordinatorEntity, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="€",
+            unit=UNIT_EUR,
             device_class=SensorDeviceClass.MONETARY,
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_should_poll = False
@@ -47,26 +55,18 @@ class CoordinatorCostSavingsSensor(CoordinatorEntity, BaseUtilitySensor):
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return cost breakdown."""
-        if not self.coordinator.data:
-            return {}
-
-        data = self.coordinator.data
+        cost_savings = data.get("cost_savings", 0.0)
+        baseline_cost = data.get("baseline_cost", 0.0)
         return {
             "total_cost_eur": round(data.get("total_cost", 0.0), 2),
-            "baseline_cost_eur": round(data.get("baseline_cost", 0.0), 2),
-            "cost_savings_eur": round(data.get("cost_savings", 0.0), 2),
+            "baseline_cost_eur": round(baseline_cost, 2),
+            "cost_savings_eur": round(cost_savings, 2),
             "savings_percentage": (
-                round(
-                    100
-                    * data.get("cost_savings", 0.0)
-                    / data.get("baseline_cost", 1.0),
-                    1,
-                )
-                if data.get("baseline_cost", 0.0) > 0
+                round(100 * cost_savings / baseline_cost, 1)
+                if baseline_cost > 0
                 else 0.0
             ),
-            "planning_window_hours": len(data.get("optimized_offsets", [])),
+            "planning_window_hours": len(data.get("optimized_offsets", EMPTY_FORECAST)),
         }
@@ -8,10 +8,18 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_KWH
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    EMPTY_FORECAST,
+    translation_key_from_name,
+)
 
 
-class CoordinatorHeatBufferSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorHeatBufferSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Heat buffer sensor using optimization coordinator."""
 
     def __init__(
@@ -23,12 +31,12 @@ class CoordinatorHeatBufferSensor(CoordinatorEntity, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="kWh",
+            unit=UNIT_KWH,
             device_class="energy",
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         # For energy device_class, state_class must be 'total' not 'measurement'
         self._attr_state_class = SensorStateClass.TOTAL
@@ -39,7 +47,7 @@ class CoordinatorHeatBufferSensor(CoordinatorEntity, BaseUtilitySensor):
         """Return current buffer level."""
         if not self.coordinator.data:
             return None
-        buffer_evolution = self.coordinator.data.get("buffer_evolution", [])
+        buffer_evolution = self.coordinator.data.get("buffer_evolution", EMPTY_FORECAST)
         return buffer_evolution[0] if buffer_evolution else None
 
     @property
@@ -49,12 +57,9 @@ class CoordinatorHeatBufferSensor(CoordinatorEntity, BaseUtilitySensor):
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return buffer evolution forecast."""
-        if not self.coordinator.data:
-            return {}
         return {
-            "forecast": self.coordinator.data.get("buffer_evolution", []),
+            "forecast": data.get("buffer_evolution", EMPTY_FORECAST),
             "forecast_time_base": 60,
         }
@@ -8,10 +8,35 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_CELSIUS
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    EMPTY_FORECAST,
+    translation_key_from_name,
+)
 
+# Exposed attribute keys, in display order, with their fallback values
+_DEFAULTS: dict[str, Any] = {
+    "optimized_offsets": EMPTY_FORECAST,
+    "buffer_evolution": EMPTY_FORECAST,
+    "future_supply_temperatures": EMPTY_FORECAST,
+    "total_cost": 0.0,
+    "baseline_cost": 0.0,
+    "cost_savings": 0.0,
+    "forecast_time_base": 60,
+    "prices": EMPTY_FORECAST,
+    "demand_forecast": EMPTY_FORECAST,
+    "baseline_cop": EMPTY_FORECAST,
+    "optimized_cop": EMPTY_FORECAST,
+    "baseline_supply_temperatures": EMPTY_FORECAST,
+    "outdoor_forecast": EMPTY_FORECAST,
+}
 
-class CoordinatorHeatingCurveOffsetSensor(CoordinatorEntity, BaseUtilitySensor):
+
+class CoordinatorHeatingCurveOffsetSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Heating curve offset sensor using optimization coordinator."""
 
     def __init__(
@@ -23,12 +48,12 @@ class CoordinatorHeatingCurveOffsetSensor(CoordinatorEntity, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="°C",
+            unit=UNIT_CELSIUS,
             device_class=None,
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
@@ -47,27 +72,7 @@ class CoordinatorHeatingCurveOffsetSensor(CoordinatorEntity, BaseUtilitySensor):
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return optimization results."""
-        if not self.coordinator.data:
-            return {}
-
-        data = self.coordinator.data
-        return {
-            "optimized_offsets": data.get("optimized_offsets", []),
-            "buffer_evolution": data.get("buffer_evolution", []),
-            "future_supply_temperatures": data.get("future_supply_temperatures", []),
-            "total_cost": data.get("total_cost", 0.0),
-            "baseline_cost": data.get("baseline_cost", 0.0),
-            "cost_savings": data.get("cost_savings", 0.0),
-            "forecast_time_base": 60,
-            "prices": data.get("prices", []),
-            "demand_forecast": data.get("demand_forecast", []),
-            "baseline_cop": data.get("baseline_cop", []),
-            "optimized_cop": data.get("optimized_cop", []),
-            "baseline_supply_temperatures": data.get(
-                "baseline_supply_temperatures", []
-            ),
-            "outdoor_forecast": data.get("outdoor_forecast", []),
-        }
+        merged = {**_DEFAULTS, **data}
+        return {key: merged[key] for key in _DEFAULTS}
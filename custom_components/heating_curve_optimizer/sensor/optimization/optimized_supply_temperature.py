@@ -8,10 +8,18 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_CELSIUS
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    EMPTY_FORECAST,
+    translation_key_from_name,
+)
 
 
-class CoordinatorOptimizedSupplyTemperatureSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorOptimizedSupplyTemperatureSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Optimized supply temperature sensor using optimization coordinator."""
 
     def __init__(
@@ -23,12 +31,12 @@ class CoordinatorOptimizedSupplyTemperatureSensor(CoordinatorEntity, BaseUtility
             self,
             name=name,
             unique_id=unique_id,
-            unit="°C",
+            unit=UNIT_CELSIUS,
             device_class="temperature",
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
@@ -40,7 +48,9 @@ class CoordinatorOptimizedSupplyTemperatureSensor(CoordinatorEntity, BaseUtility
             return None
 
         # Get future supply temperatures from coordinator
-        future_temps = self.coordinator.data.get("future_supply_temperatures", [])
+        future_temps = self.coordinator.data.get(
+            "future_supply_temperatures", EMPTY_FORECAST
+        )
         if not future_temps:
             return None
 
@@ -54,15 +64,12 @@ class CoordinatorOptimizedSupplyTemperatureSensor(CoordinatorEntity, BaseUtility
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return forecast attributes."""
-        if not self.coordinator.data:
-            return {}
         return {
-            "optimized_offsets": self.coordinator.data.get("optimized_offsets", []),
-            "future_supply_temperatures": self.coordinator.data.get(
-                "future_supply_temperatures", []
+            "optimized_offsets": data.get("optimized_offsets", EMPTY_FORECAST),
+            "future_supply_temperatures": data.get(
+                "future_supply_temperatures", EMPTY_FORECAST
             ),
             "forecast_time_base": 60,
         }
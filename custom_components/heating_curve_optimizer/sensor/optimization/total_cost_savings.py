@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,15 +11,45 @@ from homeassistant.components.sensor import (
     SensorStateClass,
     RestoreSensor,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
-from ...entity import BaseUtilitySensor
+from ...const import UNAVAILABLE_STATES, UNIT_EUR
+from ...entity import BaseUtilitySensor, translation_key_from_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source changes are folded into at most one savings update per minute
+UPDATE_COOLDOWN = 60
+
+
+def _savings_rate(
+    offset: float,
+    outdoor_temp: float,
+    supply_temp: float,
+    price: float,
+    heat_demand: float,
+    cop_intercept: float,
+    outdoor_slope: float,
+    kc: float,
+) -> float:
+    """Return the positive savings rate in €/h of running with an offset.
+
+    Both COPs share everything but the supply temperature term:
+    cop = (base + coef * outdoor + k * 35) * comp - k * comp * supply
+    and electricity (kWh/h) = heat_demand (kW) / COP.
+    """
+    common = cop_intercept + outdoor_slope * outdoor_temp
+    baseline_cop = max(0.5, common - kc * supply_temp)
+    optimized_cop = max(0.5, common - kc * (supply_temp + offset))
+    rate = heat_demand * price * (1.0 / baseline_cop - 1.0 / optimized_cop)
+    # Only count positive savings (negative would mean optimization made it worse)
+    return rate if rate > 0 else 0.0
+
 
 class TotalCostSavingsSensor(RestoreSensor, BaseUtilitySensor):
     """Cumulative cost savings sensor tracking total savings since activation."""
@@ -41,19 +71,18 @@ class TotalCostSavingsSensor(RestoreSensor, BaseUtilitySensor):
         base_cop: float,
         outdoor_temp_coefficient: float,
         cop_compensation_factor: float,
-        time_base: int = 60,
     ):
         """Initialize the sensor."""
         BaseUtilitySensor.__init__(
             self,
             name=name,
             unique_id=unique_id,
-            unit="€",
+            unit=UNIT_EUR,
             device_class=SensorDeviceClass.MONETARY,
             icon=icon,
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self.hass = hass
         self._attr_state_class = SensorStateClass.TOTAL
@@ -66,21 +95,37 @@ class TotalCostSavingsSensor(RestoreSensor, BaseUtilitySensor):
         self.calculated_supply_sensor = calculated_supply_sensor
         self.consumption_price_sensor = consumption_price_sensor
         self.heat_demand_sensor = heat_demand_sensor
+        self._watched = (
+            offset_sensor,
+            outdoor_sensor,
+            calculated_supply_sensor,
+            consumption_price_sensor,
+            heat_demand_sensor,
+        )
 
         # COP parameters
         self.k_factor = k_factor
         self.base_cop = base_cop
         self.outdoor_temp_coefficient = outdoor_temp_coefficient
         self.cop_compensation_factor = cop_compensation_factor
-        self.time_base = time_base
+
+        # Loop-invariant terms of the savings rate calculation
+        self._kc = k_factor * cop_compensation_factor
+        self._cop_intercept = (base_cop + k_factor * 35) * cop_compensation_factor
+        self._outdoor_slope = outdoor_temp_coefficient * cop_compensation_factor
 
         # Tracking state
         self._last_update: datetime | None = None
+        # Formatted on first read after each change
+        self._last_update_iso: str | None = None
         self._total_savings = 0.0
-        self._unsub_timer = None
+        # Savings rate (€/h) of the current inputs and when it took effect;
+        # savings are integrated over the time between source changes.
+        self._savings_rate = 0.0
+        self._rate_since: datetime | None = None
 
     async def async_added_to_hass(self) -> None:
-        """Restore state when added to hass."""
+        """Restore state and start tracking the source sensors."""
         await super().async_added_to_hass()
 
         # Restore previous state
@@ -90,109 +135,125 @@ class TotalCostSavingsSensor(RestoreSensor, BaseUtilitySensor):
             self._attr_native_value = self._total_savings
             _LOGGER.debug("Restored total cost savings: €%.3f", self._total_savings)
 
-        # Start periodic updates
-        update_interval = timedelta(minutes=self.time_base)
-        self._unsub_timer = async_track_time_interval(
-            self.hass, self._async_update_savings, update_interval
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=UPDATE_COOLDOWN,
+            immediate=True,
+            function=self._async_update_savings,
+        )
+        self.async_on_remove(self._async_flush_savings)
+        # Restore data is saved after the stop event, so book the open period
+        # there; otherwise the time since the last source change is lost
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when removed."""
-        if self._unsub_timer:
-            self._unsub_timer()
-            self._unsub_timer = None
-        await super().async_will_remove_from_hass()
+        self._rate_since = dt_util.utcnow()
+        self._savings_rate = self._current_savings_rate()
+        watched = [entity_id for entity_id in self._watched if entity_id]
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, watched, self._handle_change)
+        )
 
     @callback
-    async def _async_update_savings(self, now: datetime | None = None) -> None:
-        """Update cumulative savings periodically."""
+    def _handle_change(self, event) -> None:
+        self._debouncer.async_schedule_call()
+
+    def _current_savings_rate(self) -> float:
+        """Return the savings rate in €/h for the current source states."""
         # Get current states
-        offset_state = self.hass.states.get(self.offset_sensor)
-        outdoor_state = self.hass.states.get(self.outdoor_sensor)
-        calculated_supply_state = self.hass.states.get(self.calculated_supply_sensor)
-        price_state = self.hass.states.get(self.consumption_price_sensor)
-        demand_state = self.hass.states.get(self.heat_demand_sensor)
+        states = tuple(map(self.hass.states.get, self._watched))
 
         # Check all required states are available
-        if (
-            not offset_state
-            or not outdoor_state
-            or not calculated_supply_state
-            or not price_state
-            or not demand_state
-            or offset_state.state in ("unknown", "unavailable")
-            or outdoor_state.state in ("unknown", "unavailable")
-            or calculated_supply_state.state in ("unknown", "unavailable")
-            or price_state.state in ("unknown", "unavailable")
-            or demand_state.state in ("unknown", "unavailable")
-        ):
+        if any(state is None or state.state in UNAVAILABLE_STATES for state in states):
             _LOGGER.debug("Not all sensors available for savings calculation")
-            return
+            return 0.0
 
         try:
-            current_offset = float(offset_state.state)
-            outdoor_temp = float(outdoor_state.state)
-            baseline_supply_temp = float(calculated_supply_state.state)
-            current_price = float(price_state.state)
-            heat_demand = float(demand_state.state)
+            (
+                current_offset,
+                outdoor_temp,
+                baseline_supply_temp,
+                current_price,
+                heat_demand,
+            ) = (float(state.state) for state in states)
         except (ValueError, TypeError):
             _LOGGER.warning("Invalid sensor values for savings calculation")
-            return
+            return 0.0
 
         # Only calculate savings if offset is active and heat demand is positive
         if abs(current_offset) < 0.01 or heat_demand <= 0:
-            return
-
-        # Get optimized supply temperature from offset sensor attributes
-        optimized_supply_temp = baseline_supply_temp + current_offset
-
-        # Calculate baseline COP (without offset)
-        baseline_cop = (
-            self.base_cop
-            + self.outdoor_temp_coefficient * outdoor_temp
-            - self.k_factor * (baseline_supply_temp - 35)
-        ) * self.cop_compensation_factor
-        baseline_cop = max(0.5, baseline_cop)
-
-        # Calculate optimized COP (with offset)
-        optimized_cop = (
-            self.base_cop
-            + self.outdoor_temp_coefficient * outdoor_temp
-            - self.k_factor * (optimized_supply_temp - 35)
-        ) * self.cop_compensation_factor
-        optimized_cop = max(0.5, optimized_cop)
-
-        # Calculate electricity consumption for both scenarios
-        # electricity (kWh) = heat_demand (kW) * time_base (hours) / COP
-        time_hours = self.time_base / 60.0
-
-        baseline_electricity = (heat_demand / baseline_cop) * time_hours
-        optimized_electricity = (heat_demand / optimized_cop) * time_hours
-
-        # Calculate cost difference
-        baseline_cost = baseline_electricity * current_price
-        optimized_cost = optimized_electricity * current_price
-        period_savings = baseline_cost - optimized_cost
-
-        # Only add positive savings (negative would mean optimization made it worse)
-        if period_savings > 0:
-            self._total_savings += period_savings
-            self._attr_native_value = round(self._total_savings, 3)
-            self._last_update = dt_util.utcnow()
-
-            _LOGGER.debug(
-                "Period savings: €%.4f (total: €%.3f)",
-                period_savings,
-                self._total_savings,
-            )
+            return 0.0
+
+        return _savings_rate(
+            current_offset,
+            outdoor_temp,
+            baseline_supply_temp,
+            current_price,
+            heat_demand,
+            self._cop_intercept,
+            self._outdoor_slope,
+            self._kc,
+        )
+
+    def _accrue_savings(self) -> bool:
+        """Book the savings since the last source change.
+
+        Returns True when the published (rounded) total changed.
+        """
+        now = dt_util.utcnow()
+        since = self._rate_since or now
+        period_savings = self._savings_rate * (now - since).total_seconds() / 3600
+        self._rate_since = now
+        if period_savings <= 0:
+            return False
+
+        self._total_savings += period_savings
+        self._last_update = now
+        self._last_update_iso = None
+
+        _LOGGER.debug(
+            "Period savings: €%.4f (total: €%.3f)",
+            period_savings,
+            self._total_savings,
+        )
 
+        # Short periods often add less than the published resolution;
+        # keep accumulating and only report once the rounded total moves.
+        total = round(self._total_savings, 3)
+        if total == self._attr_native_value:
+            return False
+        self._attr_native_value = total
+        return True
+
+    async def _async_update_savings(self) -> None:
+        """Add the savings accrued since the last source change."""
+        changed = self._accrue_savings()
+        self._savings_rate = self._current_savings_rate()
+        if changed:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_handle_stop(self, _event: Event) -> None:
+        """Book the still open period before Home Assistant shuts down."""
+        if self._accrue_savings():
             self.async_write_ha_state()
 
+    @callback
+    def _async_flush_savings(self) -> None:
+        """Cancel pending updates and book the still open period on removal."""
+        self._debouncer.async_cancel()
+        self._accrue_savings()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         if self._last_update:
-            attrs["last_update"] = self._last_update.isoformat()
-        attrs["time_base_minutes"] = self.time_base
+            if self._last_update_iso is None:
+                self._last_update_iso = self._last_update.isoformat()
+            attrs["last_update"] = self._last_update_iso
         return attrs
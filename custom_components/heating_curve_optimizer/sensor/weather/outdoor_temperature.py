@@ -8,10 +8,17 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...entity import BaseUtilitySensor
+from ...const import UNIT_CELSIUS
+from ...entity import (
+    BaseUtilitySensor,
+    CachedAttributesMixin,
+    translation_key_from_name,
+)
 
 
-class CoordinatorOutdoorTemperatureSensor(CoordinatorEntity, BaseUtilitySensor):
+class CoordinatorOutdoorTemperatureSensor(
+    CachedAttributesMixin, CoordinatorEntity, BaseUtilitySensor
+):
     """Outdoor temperature sensor using weather coordinator."""
 
     def __init__(self, coordinator, name: str, unique_id: str, device: DeviceInfo):
@@ -21,12 +28,12 @@ class CoordinatorOutdoorTemperatureSensor(CoordinatorEntity, BaseUtilitySensor):
             self,
             name=name,
             unique_id=unique_id,
-            unit="°C",
+            unit=UNIT_CELSIUS,
             device_class="temperature",
             icon="mdi:thermometer",
             visible=True,
             device=device,
-            translation_key=name.lower().replace(" ", "_").replace(".", "_"),
+            translation_key=translation_key_from_name(name),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_should_poll = False
@@ -45,13 +52,10 @@ class CoordinatorOutdoorTemperatureSensor(CoordinatorEntity, BaseUtilitySensor):
             self.coordinator.last_update_success and self.coordinator.data is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return forecast attributes."""
-        if not self.coordinator.data:
-            return {}
         return {
-            "forecast": self.coordinator.data.get("temperature_forecast", []),
-            "humidity_forecast": self.coordinator.data.get("humidity_forecast", []),
+            "forecast": data.get("temperature_forecast", []),
+            "humidity_forecast": data.get("humidity_forecast", []),
             "forecast_time_base": 60,
         }
@@ -230,6 +230,61 @@ async def test_base_utility_sensor_set_value(hass: HomeAssistant, device_info):
     assert sensor._attr_native_value == 3.12345679  # Rounded to 8 decimals
 
 
+@pytest.mark.asyncio
+async def test_base_utility_sensor_set_value_skips_unchanged(
+    hass: HomeAssistant, device_info
+):
+    """Test set_value only writes state when the rounded value changes."""
+    sensor = BaseUtilitySensor(
+        name="Test Sensor",
+        unique_id="test_set_value_unchanged",
+        unit="kW",
+        device_class=None,
+        icon="mdi:test",
+        visible=True,
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.test_set_value_unchanged"
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor.set_value(1.5)
+        sensor.set_value(1.500000001)
+        assert mock_write.call_count == 1
+
+        sensor.set_value(2.0)
+        assert mock_write.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_base_utility_sensor_set_value_writes_availability_change(
+    hass: HomeAssistant, device_info
+):
+    """Test set_value writes when only the availability changed."""
+    sensor = BaseUtilitySensor(
+        name="Test Sensor",
+        unique_id="test_set_value_availability",
+        unit="kW",
+        device_class=None,
+        icon="mdi:test",
+        visible=True,
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.test_set_value_availability"
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor.set_value(1.5)
+        sensor._set_unavailable("Test reason")
+        sensor.set_value(1.5)
+        assert mock_write.call_count == 2
+
+        # Coming back with the old value must still be written
+        sensor._mark_available()
+        sensor.set_value(1.5)
+        assert mock_write.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_base_utility_sensor_unavailable_marking(
     hass: HomeAssistant, device_info
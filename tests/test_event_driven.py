@@ -0,0 +1,307 @@
+"""Test the event-driven sensors."""
+
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.heating_curve_optimizer.const import SOURCE_TYPE_CONSUMPTION
+from custom_components.heating_curve_optimizer.sensor.event_driven import (
+    CopEfficiencyDeltaSensor,
+    CurrentElectricityPriceSensor,
+    HeatGenerationDeltaSensor,
+    HeatPumpThermalPowerSensor,
+    UPDATE_COOLDOWN,
+)
+
+RESTORE = "custom_components.heating_curve_optimizer.entity.RestoreEntity.async_get_last_state"
+
+
+@pytest.fixture
+def device_info():
+    """Create mock device info."""
+    return DeviceInfo(identifiers={("test", "1")})
+
+
+@pytest.mark.asyncio
+async def test_price_sensor_publishes_unavailable_source(
+    hass: HomeAssistant, device_info
+):
+    """Test the price follows its source through an unavailable period."""
+    hass.states.async_set("sensor.price", "0.25", {"unit": "EUR/kWh"})
+    sensor = CurrentElectricityPriceSensor(
+        name="Current Electricity Price",
+        unique_id="test_current_electricity_price",
+        price_sensor="sensor.price",
+        source_type=SOURCE_TYPE_CONSUMPTION,
+        price_settings={},
+        icon="mdi:flash",
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.current_electricity_price"
+
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+        assert sensor.available
+        assert sensor.native_value == 0.25
+        assert sensor.extra_state_attributes["unit"] == "EUR/kWh"
+
+        hass.states.async_set("sensor.price", "unavailable")
+        await hass.async_block_till_done()
+        assert not sensor.available
+        assert sensor.extra_state_attributes == {}
+        assert mock_write.call_count == 1
+
+        # Staying unavailable is not written again
+        hass.states.async_set("sensor.price", "unknown")
+        await hass.async_block_till_done()
+        assert mock_write.call_count == 1
+
+        hass.states.async_set("sensor.price", "0.30", {"unit": "EUR/kWh"})
+        await hass.async_block_till_done()
+        assert sensor.available
+        assert sensor.native_value == 0.30
+        assert sensor.extra_state_attributes["unit"] == "EUR/kWh"
+        assert mock_write.call_count == 2
+
+
+def _thermal_power_sensor(hass, device_info, outdoor_sensor="sensor.outdoor"):
+    sensor = HeatPumpThermalPowerSensor(
+        name="Heat Pump Thermal Power",
+        unique_id="test_thermal_power",
+        power_sensor="sensor.power",
+        supply_sensor="sensor.supply",
+        outdoor_sensor=outdoor_sensor,
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.heat_pump_thermal_power"
+    return sensor
+
+
+@pytest.mark.asyncio
+async def test_thermal_power_tracks_source_cache(hass: HomeAssistant, device_info):
+    """Test source values are parsed once and refreshed by state events."""
+    hass.states.async_set("sensor.power", "1000")
+    hass.states.async_set("sensor.supply", "35")
+    hass.states.async_set("sensor.outdoor", "5")
+    sensor = _thermal_power_sensor(hass, device_info)
+
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+        assert sensor.available
+        # COP 4.2 + 0.08 * 5 at a 35°C supply
+        assert sensor.native_value == 4.6
+        assert sensor._source_cache == {
+            "sensor.power": (1000.0, None),
+            "sensor.supply": (35.0, None),
+            "sensor.outdoor": (5.0, None),
+        }
+
+        hass.states.async_set("sensor.power", "2000")
+        await hass.async_block_till_done()
+
+        assert sensor._source_cache["sensor.power"] == (2000.0, None)
+        assert sensor.native_value == 9.2
+        assert mock_write.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_thermal_power_skips_unchanged_write(hass: HomeAssistant, device_info):
+    """Test no state is written when value and availability are unchanged."""
+    hass.states.async_set("sensor.power", "1000")
+    hass.states.async_set("sensor.supply", "35")
+    hass.states.async_set("sensor.outdoor", "5")
+    sensor = _thermal_power_sensor(hass, device_info)
+
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+
+        # Attribute-only update
+        hass.states.async_set("sensor.power", "1000", {"unit": "W"})
+        await hass.async_block_till_done()
+        # Different string, same parsed value
+        hass.states.async_set("sensor.power", "1000.0")
+        await hass.async_block_till_done()
+        # Change below the rounding of the output
+        hass.states.async_set("sensor.power", "1000.01")
+        await hass.async_block_till_done()
+
+        assert sensor.native_value == 4.6
+        mock_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_thermal_power_unavailable_reasons(hass: HomeAssistant, device_info):
+    """Test each unusable source marks the sensor unavailable with a reason."""
+    hass.states.async_set("sensor.supply", "35")
+    hass.states.async_set("sensor.outdoor", "5")
+    sensor = _thermal_power_sensor(hass, device_info)
+
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+        assert not sensor.available
+        assert (
+            sensor._last_unavailable_reason
+            == "vermogenssensor sensor.power werd niet gevonden"
+        )
+
+        hass.states.async_set("sensor.power", "1000")
+        await hass.async_block_till_done()
+        assert sensor.available
+        assert sensor._last_unavailable_reason is None
+
+        hass.states.async_set("sensor.supply", "unavailable")
+        await hass.async_block_till_done()
+        assert not sensor.available
+        assert (
+            sensor._last_unavailable_reason
+            == "aanvoersensor sensor.supply heeft status 'unavailable'"
+        )
+
+        hass.states.async_set("sensor.supply", "35")
+        await hass.async_block_till_done()
+        assert sensor.available
+
+        hass.states.async_set("sensor.outdoor", "abc")
+        await hass.async_block_till_done()
+        assert not sensor.available
+        assert (
+            sensor._last_unavailable_reason
+            == "waarde van buitensensor sensor.outdoor is ongeldig"
+        )
+
+        # Every availability change is written
+        assert mock_write.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_thermal_power_late_outdoor_reference(hass: HomeAssistant, device_info):
+    """Test an outdoor entity reference is tracked once it has an entity_id."""
+    hass.states.async_set("sensor.power", "1000")
+    hass.states.async_set("sensor.supply", "35")
+    hass.states.async_set("sensor.outdoor", "5")
+    outdoor = SensorEntity()
+    sensor = _thermal_power_sensor(hass, device_info, outdoor_sensor=outdoor)
+
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+        assert not sensor.available
+        assert sensor._last_unavailable_reason == "geen buitensensor gevonden"
+
+        outdoor.entity_id = "sensor.outdoor"
+        hass.states.async_set("sensor.power", "2000")
+        await hass.async_block_till_done()
+        assert sensor.available
+        assert sensor.native_value == 9.2
+
+        hass.states.async_set("sensor.outdoor", "10")
+        await hass.async_block_till_done()
+        assert sensor._source_cache["sensor.outdoor"] == (10.0, None)
+        # COP 4.2 + 0.08 * 10
+        assert sensor.native_value == 10.0
+        assert mock_write.call_count == 2
+
+
+async def _assert_changes_coalesced(hass, sensor, changes):
+    """Add the sensor, fire the changes and expect a single refresh."""
+    with (
+        patch(RESTORE, new=AsyncMock(return_value=None)),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        await sensor.async_added_to_hass()
+        with patch.object(
+            sensor, "_compute_value", wraps=sensor._compute_value
+        ) as mock_compute:
+            for entity_id, value in changes:
+                hass.states.async_set(entity_id, value)
+            await hass.async_block_till_done()
+            mock_compute.assert_not_called()
+
+            async_fire_time_changed(
+                hass, dt_util.utcnow() + timedelta(seconds=UPDATE_COOLDOWN * 2)
+            )
+            await hass.async_block_till_done()
+
+            assert mock_compute.call_count == 1
+            assert mock_write.call_count == 1
+        sensor._debouncer.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_cop_delta_coalesces_source_changes(hass: HomeAssistant, device_info):
+    """Test changes within the cooldown give one recompute and one write."""
+    hass.states.async_set("sensor.cop", "4.0")
+    hass.states.async_set("sensor.offset", "0")
+    hass.states.async_set("sensor.outdoor", "5")
+    hass.states.async_set("sensor.supply", "35")
+    sensor = CopEfficiencyDeltaSensor(
+        name="COP Delta",
+        unique_id="test_cop_delta",
+        cop_sensor="sensor.cop",
+        offset_entity="sensor.offset",
+        outdoor_sensor="sensor.outdoor",
+        calculated_supply_sensor="sensor.supply",
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.cop_delta"
+
+    await _assert_changes_coalesced(
+        hass,
+        sensor,
+        [("sensor.offset", "1"), ("sensor.outdoor", "6"), ("sensor.supply", "36")],
+    )
+
+
+@pytest.mark.asyncio
+async def test_heat_generation_delta_coalesces_source_changes(
+    hass: HomeAssistant, device_info
+):
+    """Test changes within the cooldown give one recompute and one write."""
+    hass.states.async_set("sensor.offset", "0")
+    hass.states.async_set("sensor.net_heat_loss", "2.0")
+    sensor = HeatGenerationDeltaSensor(
+        name="Heat Generation Delta",
+        unique_id="test_heat_generation_delta",
+        thermal_power_sensor="sensor.thermal_power",
+        cop_sensor="sensor.cop",
+        offset_entity="sensor.offset",
+        outdoor_sensor="sensor.outdoor",
+        calculated_supply_sensor="sensor.supply",
+        net_heat_loss_sensor="sensor.net_heat_loss",
+        device=device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.heat_generation_delta"
+
+    await _assert_changes_coalesced(
+        hass,
+        sensor,
+        [
+            ("sensor.offset", "1"),
+            ("sensor.net_heat_loss", "2.5"),
+            ("sensor.offset", "2"),
+        ],
+    )
@@ -12,6 +12,8 @@ from custom_components.heating_curve_optimizer.helpers import (
     extract_price_forecast,
     calculate_supply_temperature,
     calculate_defrost_factor,
+    price_forecast_key,
+    same_price_forecast_key,
 )
 
 
@@ -379,3 +381,17 @@ def test_extract_price_forecast_skips_invalid_values():
 
     prices, interval = extract_price_forecast_with_interval(state)
     assert prices == [0.20, 0.30, 0.35]
+
+
+def test_same_price_forecast_key():
+    """Keys match only for the same attributes object and state value."""
+    state = State("sensor.price", "0.25", {"raw_today": [0.1, 0.2]})
+    key = price_forecast_key(state)
+    assert same_price_forecast_key(key, price_forecast_key(state))
+    assert not same_price_forecast_key(None, key)
+
+    changed = State("sensor.price", "0.30", state.attributes)
+    assert not same_price_forecast_key(key, price_forecast_key(changed))
+
+    copied = State("sensor.price", "0.25", dict(state.attributes))
+    assert not same_price_forecast_key(key, price_forecast_key(copied))
@@ -1,9 +1,12 @@
 """Test all modular sensors."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.components.sensor import SensorStateClass
+from homeassistant.components.sensor import SensorExtraStoredData, SensorStateClass
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 
 # Weather sensors
 from custom_components.heating_curve_optimizer.sensor.weather.outdoor_temperature import (
@@ -37,6 +40,10 @@ from custom_components.heating_curve_optimizer.sensor.optimization.heat_buffer i
 from custom_components.heating_curve_optimizer.sensor.optimization.cost_savings import (
     CoordinatorCostSavingsSensor,
 )
+from custom_components.heating_curve_optimizer.sensor.optimization.total_cost_savings import (
+    TotalCostSavingsSensor,
+    _savings_rate,
+)
 
 # COP sensors
 from custom_components.heating_curve_optimizer.sensor.cop.quadratic_cop import (
@@ -427,3 +434,208 @@ async def test_sensor_with_missing_key(hass, device_info):
 
     # Should return None when key is missing
     assert sensor.native_value is None
+
+
+@pytest.mark.asyncio
+async def test_heat_loss_attributes_cached_per_coordinator_data(hass, device_info):
+    """Test heat loss attributes are rebuilt only when coordinator data changes."""
+    mock_coordinator = MagicMock()
+    mock_coordinator.data = {"heat_loss": 2.5, "heat_loss_forecast": [2.5, 2.6]}
+    mock_coordinator.last_update_success = True
+    mock_coordinator.config = {"area_m2": 150, "energy_label": "C"}
+
+    sensor = CoordinatorHeatLossSensor(
+        coordinator=mock_coordinator,
+        name="Heat Loss",
+        unique_id="test_heat_loss",
+        icon="mdi:fire",
+        device=device_info,
+    )
+
+    attrs = sensor.extra_state_attributes
+    assert attrs["forecast"] == [2.5, 2.6]
+    assert attrs["energy_label"] == "C"
+    assert sensor.extra_state_attributes is attrs
+
+    mock_coordinator.data = {"heat_loss": 2.7, "heat_loss_forecast": [2.7]}
+    new_attrs = sensor.extra_state_attributes
+    assert new_attrs is not attrs
+    assert new_attrs["forecast"] == [2.7]
+    assert new_attrs["htc_total_w_per_k"] == attrs["htc_total_w_per_k"]
+
+
+def test_total_cost_savings_rate():
+    """Test the savings rate matches the per-scenario electricity cost."""
+    base_cop, coef, k, comp = 4.2, 0.08, 0.11, 1.0
+    outdoor, supply, offset, price, demand = 5.0, 40.0, -2.0, 0.30, 3.0
+
+    def cop(s_temp):
+        return max(0.5, (base_cop + coef * outdoor - k * (s_temp - 35)) * comp)
+
+    expected = demand / cop(supply) * price - demand / cop(supply + offset) * price
+    rate = _savings_rate(
+        offset,
+        outdoor,
+        supply,
+        price,
+        demand,
+        (base_cop + k * 35) * comp,
+        coef * comp,
+        k * comp,
+    )
+    assert rate == pytest.approx(expected)
+
+    # A positive offset lowers the COP; negative savings are not counted
+    worse = _savings_rate(
+        2.0, outdoor, supply, price, demand, base_cop + k * 35, coef, k
+    )
+    assert worse == 0.0
+
+
+def _total_cost_savings_sensor(hass, device_info):
+    """Create a total savings sensor with an active offset on its sources."""
+    sources = {
+        "sensor.offset": "-2.0",
+        "sensor.outdoor": "5.0",
+        "sensor.supply": "40.0",
+        "sensor.price": "0.30",
+        "sensor.demand": "3.0",
+    }
+    for entity_id, value in sources.items():
+        hass.states.async_set(entity_id, value)
+
+    sensor = TotalCostSavingsSensor(
+        hass=hass,
+        name="Total Cost Savings",
+        unique_id="test_total_cost_savings",
+        icon="mdi:piggy-bank",
+        device=device_info,
+        offset_sensor="sensor.offset",
+        outdoor_sensor="sensor.outdoor",
+        calculated_supply_sensor="sensor.supply",
+        consumption_price_sensor="sensor.price",
+        heat_demand_sensor="sensor.demand",
+        k_factor=0.11,
+        base_cop=4.2,
+        outdoor_temp_coefficient=0.08,
+        cop_compensation_factor=1.0,
+    )
+    sensor.entity_id = "sensor.total_cost_savings"
+    return sensor
+
+
+async def test_total_cost_savings_integrates_rate(hass, device_info):
+    """Test savings are integrated over the periods between source changes."""
+    sensor = _total_cost_savings_sensor(hass, device_info)
+
+    def rate(price):
+        return _savings_rate(
+            -2.0,
+            5.0,
+            40.0,
+            price,
+            3.0,
+            sensor._cop_intercept,
+            sensor._outdoor_slope,
+            sensor._kc,
+        )
+
+    start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    with (
+        patch("homeassistant.util.dt.utcnow") as mock_now,
+        patch(
+            "custom_components.heating_curve_optimizer.entity.RestoreEntity.async_get_last_state",
+            new=AsyncMock(return_value=None),
+        ),
+        patch.object(
+            sensor, "async_get_last_sensor_data", AsyncMock(return_value=None)
+        ),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        mock_now.return_value = start
+        await sensor.async_added_to_hass()
+        # Run the debounced update by hand to control the period boundaries
+        sensor._debouncer = MagicMock()
+
+        mock_now.return_value = start + timedelta(hours=1)
+        hass.states.async_set("sensor.price", "0.40")
+        await hass.async_block_till_done()
+        await sensor._async_update_savings()
+
+        mock_now.return_value = start + timedelta(hours=1, minutes=30)
+        hass.states.async_set("sensor.price", "0.20")
+        await hass.async_block_till_done()
+        await sensor._async_update_savings()
+
+        expected = rate(0.30) + 0.5 * rate(0.40)
+        assert sensor._total_savings == pytest.approx(expected)
+        assert sensor.native_value == round(expected, 3)
+        assert sensor._debouncer.async_schedule_call.call_count == 2
+        assert mock_write.call_count == 2
+
+        # Removal books the open period without writing
+        mock_now.return_value = start + timedelta(hours=3)
+        sensor._async_flush_savings()
+
+    expected += 1.5 * rate(0.20)
+    assert sensor._total_savings == pytest.approx(expected)
+    assert sensor.native_value == round(expected, 3)
+    sensor._debouncer.async_cancel.assert_called_once()
+    assert mock_write.call_count == 2
+    assert "time_base_minutes" not in sensor.extra_state_attributes
+
+
+async def test_total_cost_savings_restores_open_period(hass, device_info):
+    """Test the period since the last source change survives a restart."""
+    sensor = _total_cost_savings_sensor(hass, device_info)
+    rate = _savings_rate(
+        -2.0,
+        5.0,
+        40.0,
+        0.30,
+        3.0,
+        sensor._cop_intercept,
+        sensor._outdoor_slope,
+        sensor._kc,
+    )
+
+    start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    with (
+        patch("homeassistant.util.dt.utcnow") as mock_now,
+        patch(
+            "custom_components.heating_curve_optimizer.entity.RestoreEntity.async_get_last_state",
+            new=AsyncMock(return_value=None),
+        ),
+        patch.object(
+            sensor, "async_get_last_sensor_data", AsyncMock(return_value=None)
+        ),
+        patch.object(sensor, "async_write_ha_state") as mock_write,
+    ):
+        mock_now.return_value = start
+        await sensor.async_added_to_hass()
+
+        # No source changes before shutdown
+        mock_now.return_value = start + timedelta(hours=2)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        mock_write.assert_called_once()
+
+    stored = sensor.extra_restore_state_data.as_dict()
+    assert stored["native_value"] == round(2 * rate, 3)
+
+    restarted = _total_cost_savings_sensor(hass, device_info)
+    with (
+        patch(
+            "custom_components.heating_curve_optimizer.entity.RestoreEntity.async_get_last_state",
+            new=AsyncMock(return_value=None),
+        ),
+        patch.object(
+            restarted,
+            "async_get_last_sensor_data",
+            AsyncMock(return_value=SensorExtraStoredData.from_dict(stored)),
+        ),
+    ):
+        await restarted.async_added_to_hass()
+
+    assert restarted.native_value == round(2 * rate, 3)
+    assert restarted._total_savings == pytest.approx(round(2 * rate, 3))